@@ -16,16 +16,34 @@ Stop at any time with Ctrl+C or SIGTERM.
 
 import sys
 import os
+import re
 import json
+import hashlib
 import subprocess
 import threading
+import queue
 import time
 import signal
+import atexit
 import argparse
-import urllib.request
-import urllib.error
+import http.client
 from datetime import datetime
 
+try:
+    # Optional: orjson (C) decodes the multi-KB streamed narration chunks
+    # several times faster than stdlib json. Everything works without it.
+    import orjson
+
+    _json_loads = orjson.loads
+
+    def _json_dumps(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    _json_loads = json.loads
+
+    def _json_dumps(obj):
+        return json.dumps(obj).encode()
+
 # ── Paths ─────────────────────────────────────────────────────────────────────
 SCRIPT_DIR  = os.path.dirname(os.path.abspath(__file__))
 SKILLS_DIR  = os.path.dirname(SCRIPT_DIR)
@@ -33,7 +51,8 @@ HUENIT_DIR  = os.path.join(SKILLS_DIR, "huenit")
 VOICE_DIR   = os.path.join(SKILLS_DIR, "voice")
 
 # ── Config ────────────────────────────────────────────────────────────────────
-OLLAMA_URL       = "http://localhost:11434/api/generate"
+OLLAMA_HOST      = "localhost"
+OLLAMA_PORT      = 11434
 OLLAMA_MODEL     = "qwen2.5:7b"
 PORT             = os.environ.get("HUENIT_PORT", "/dev/cu.usbserial-310")
 CALIBRATION_FILE = os.path.join(HUENIT_DIR, "calibration.json")
@@ -41,9 +60,21 @@ CALIBRATION_FILE = os.path.join(HUENIT_DIR, "calibration.json")
 # Seconds between live commentary phrases while drawing
 COMMENTARY_INTERVAL = 6
 
+# On-disk narration cache — demo installs request the same shapes/words
+# over and over, so a cache hit turns a ~30 s Qwen call into a file read.
+CACHE_DIR = os.path.join(SCRIPT_DIR, ".narration_cache")
+
 # Log file
 LOG_FILE = os.path.join(SCRIPT_DIR, "bob_ross.log")
 
+try:
+    # One O_APPEND fd for the whole session instead of an open/close pair
+    # per entry; O_APPEND keeps concurrent writes atomic without a lock.
+    _LOG_FD = os.open(LOG_FILE, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+    atexit.register(os.close, _LOG_FD)
+except Exception:
+    _LOG_FD = None
+
 
 def log(event, detail=""):
     """Append a timestamped log entry."""
@@ -51,26 +82,111 @@ def log(event, detail=""):
     line = f"[{ts}] {event}"
     if detail:
         line += f" — {detail}"
-    try:
-        with open(LOG_FILE, "a") as f:
-            f.write(line + "\n")
-    except Exception:
-        pass  # never let logging break the main flow
+    if _LOG_FD is not None:
+        try:
+            os.write(_LOG_FD, (line + "\n").encode())
+        except Exception:
+            pass  # never let logging break the main flow
     print(line)
 
 
 # ── Shared state ──────────────────────────────────────────────────────────────
 stop_flag = threading.Event()
+_draw_wake = threading.Event()  # set on stop signal or when a draw finishes
 _draw_proc = None
 _draw_proc_lock = threading.Lock()
+_gcode_io = None  # persistent serial handle for in-process drawing
+
+
+# ── Huenit in-process access ──────────────────────────────────────────────────
+def _huenit_module(name):
+    """Import a huenit script as a module (the skill folder is not a package)."""
+    if HUENIT_DIR not in sys.path:
+        sys.path.insert(0, HUENIT_DIR)
+    import importlib
+    return importlib.import_module(name)
+
+
+def _get_gcode_io():
+    """Open the serial port once and reuse it — each reopen costs a ~2 s DTR
+    reset on the controller, plus a fresh G21/G91 handshake."""
+    global _gcode_io
+    if _gcode_io is None:
+        hd = _huenit_module("huenit_draw")
+        _gcode_io = hd.GCodeIO(PORT, hd.BAUD)
+        _gcode_io.set_modes("G21", "G91")  # metric, relative — one line, one ok
+    return _gcode_io
+
+
+def _close_gcode_io():
+    """Restore absolute mode and release the shared serial handle."""
+    global _gcode_io
+    if _gcode_io is not None:
+        try:
+            _gcode_io.set_modes("G90")
+        except Exception:
+            pass
+        _gcode_io.close()
+        _gcode_io = None
 
 
 # ── Voice ─────────────────────────────────────────────────────────────────────
+class SpeakClient:
+    """Persistent speak_daemon.py worker — one Python/TTS startup per session
+    instead of one per phrase."""
+
+    def __init__(self):
+        self.proc = None
+        self.lock = threading.Lock()
+
+    def _ensure(self):
+        if self.proc is None or self.proc.poll() is not None:
+            self.proc = subprocess.Popen(
+                ["python3", os.path.join(VOICE_DIR, "speak_daemon.py")],
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                text=True,
+                bufsize=1,
+            )
+        return self.proc
+
+    def say(self, text):
+        """Send one phrase and block for the daemon's ack. False on failure."""
+        with self.lock:
+            try:
+                proc = self._ensure()
+                proc.stdin.write(text.replace("\n", " ") + "\n")
+                proc.stdin.flush()
+                while True:
+                    line = proc.stdout.readline()
+                    if not line:
+                        return False  # daemon died mid-phrase
+                    if line.strip() == "done":
+                        return True
+            except Exception as e:
+                print(f"  ⚠  voice worker error: {e}")
+                return False
+
+    def close(self):
+        if self.proc is not None:
+            try:
+                self.proc.stdin.close()
+            except Exception:
+                pass
+            self.proc = None
+
+
+_speak_client = SpeakClient()
+
+
 def speak(text):
-    """Speak text via speak.py. Blocks until done."""
+    """Speak text via the persistent voice worker. Blocks until done."""
     if stop_flag.is_set():
         return
     print(f"  🗣  {text}")
+    if _speak_client.say(text):
+        return
+    # Fallback: one-shot speak.py subprocess
     try:
         subprocess.run(
             ["python3", os.path.join(VOICE_DIR, "speak.py"), text],
@@ -82,23 +198,92 @@ def speak(text):
         print(f"  ⚠  speak.py error: {e}")
 
 
+PING_FILE = "/System/Library/Sounds/Ping.aiff"
+
+try:
+    # macOS: preload the warning sound once so the three beeps replay a
+    # buffer instead of spawning three afplay processes.
+    from AppKit import NSSound
+    _ping_sound = NSSound.alloc().initWithContentsOfFile_byReference_(PING_FILE, True)
+except Exception:
+    _ping_sound = None
+
+
 def warning_tone():
     """Three Ping beeps to warn humans to step away."""
-    ping = "/System/Library/Sounds/Ping.aiff"
     for _ in range(3):
         if stop_flag.is_set():
             return
+        if _ping_sound is not None:
+            _ping_sound.stop()  # rewind in case the previous beep still plays
+            _ping_sound.play()
+        else:
+            try:
+                subprocess.run(["afplay", PING_FILE], capture_output=True, timeout=3)
+            except Exception:
+                # Fallback: use say with a short beep word
+                subprocess.run(["say", "-v", "Evan", "beep"], capture_output=True, timeout=3)
+        time.sleep(0.5)
+
+
+# ── Ollama connection ─────────────────────────────────────────────────────────
+_ollama_conn = None
+_ollama_lock = threading.Lock()  # guards the shared keep-alive socket
+
+
+def _ollama_request(method, path, body=None):
+    """
+    Issue a request on one shared keep-alive connection and return the
+    response body — quick probes like /api/tags reuse the same socket
+    instead of paying a TCP+HTTP setup each. The lock stays held until
+    the body is fully read, so concurrent callers can never interleave
+    on (or tear down) a socket with a response still in flight.
+    Reconnects once if the idle socket has gone stale. Streaming calls
+    use _ollama_stream instead — they hold their response for seconds
+    and must not pin this lock.
+    """
+    global _ollama_conn
+    headers = {"Content-Type": "application/json"} if body else {}
+    with _ollama_lock:
+        if _ollama_conn is None:
+            _ollama_conn = http.client.HTTPConnection(OLLAMA_HOST, OLLAMA_PORT, timeout=30)
         try:
-            subprocess.run(["afplay", ping], capture_output=True, timeout=3)
+            _ollama_conn.request(method, path, body=body, headers=headers)
+            return _ollama_conn.getresponse().read()
         except Exception:
-            # Fallback: use say with a short beep word
-            subprocess.run(["say", "-v", "Evan", "beep"], capture_output=True, timeout=3)
-        time.sleep(0.5)
+            _ollama_conn.close()
+            _ollama_conn.request(method, path, body=body, headers=headers)
+            return _ollama_conn.getresponse().read()
+
+
+def _ollama_stream(method, path, body=None):
+    """
+    Same request on a dedicated connection, returning the live response.
+    The narration generate call reads its stream while the main thread
+    probes readiness; separate sockets keep one from killing the other.
+    The caller closes the response when done.
+    """
+    conn = http.client.HTTPConnection(OLLAMA_HOST, OLLAMA_PORT, timeout=30)
+    headers = {"Content-Type": "application/json"} if body else {}
+    conn.request(method, path, body=body, headers=headers)
+    return conn.getresponse()
 
 
 # ── Readiness check ───────────────────────────────────────────────────────────
+_ready_cache = None
+_ready_ts = 0.0
+READY_TTL = 5  # seconds a readiness result stays valid
+
+
 def readiness_check():
-    """Return a list of issues. Empty list = all good."""
+    """Return a list of issues. Empty list = all good.
+
+    Results are cached for READY_TTL seconds so back-to-back checks in one
+    session don't re-probe the port, flags, and Ollama."""
+    global _ready_cache, _ready_ts
+    if _ready_cache is not None and time.time() - _ready_ts < READY_TTL:
+        return _ready_cache
+
     issues = []
 
     # Robot arm port
@@ -121,17 +306,15 @@ def readiness_check():
 
     # Ollama reachable
     try:
-        req = urllib.request.Request("http://localhost:11434/api/tags")
-        with urllib.request.urlopen(req, timeout=3) as resp:
-            data = json.loads(resp.read())
-            models = [m["name"] for m in data.get("models", [])]
-            if not any(OLLAMA_MODEL.split(":")[0] in m for m in models):
-                issues.append(
-                    f"Model '{OLLAMA_MODEL}' not found in Ollama. "
-                    f"Available: {', '.join(models) or 'none'}"
-                )
+        data = _json_loads(_ollama_request("GET", "/api/tags"))
+        models = [m["name"] for m in data.get("models", [])]
+        if not any(OLLAMA_MODEL.split(":")[0] in m for m in models):
+            issues.append(
+                f"Model '{OLLAMA_MODEL}' not found in Ollama. "
+                f"Available: {', '.join(models) or 'none'}"
+            )
     except Exception as e:
-        issues.append(f"Ollama not reachable at localhost:11434 — {e}")
+        issues.append(f"Ollama not reachable at {OLLAMA_HOST}:{OLLAMA_PORT} — {e}")
 
     # Huenit scripts exist
     for script in ("huenit_write.py", "huenit_draw.py"):
@@ -142,12 +325,80 @@ def readiness_check():
     if not os.path.exists(os.path.join(VOICE_DIR, "speak.py")):
         issues.append("Missing voice script: speak.py")
 
+    _ready_cache = issues
+    _ready_ts = time.time()
     return issues
 
 
 # ── Ollama narration ──────────────────────────────────────────────────────────
-def generate_narration(action, content):
-    """Ask Qwen to generate Bob Ross style narration. Returns dict or fallback."""
+def _narration_cache_path(action, content):
+    key = hashlib.sha256(f"{OLLAMA_MODEL}|{action}|{content}".encode()).hexdigest()
+    return os.path.join(CACHE_DIR, key + ".json")
+
+
+def _load_cached_narration(path):
+    """Return a cached narration dict, or None if missing/unreadable."""
+    try:
+        with open(path) as f:
+            narration = json.load(f)
+        if all(k in narration for k in ("intro", "commentary", "outro")):
+            return narration
+    except Exception:
+        pass  # corrupt or missing cache entry — just regenerate
+    return None
+
+
+def _save_cached_narration(path, narration):
+    """Atomically write a narration dict to the cache."""
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        tmp = path + ".tmp"
+        with open(tmp, "w") as f:
+            json.dump(narration, f, indent=2)
+        os.replace(tmp, path)
+    except Exception as e:
+        print(f"  ⚠  Could not write narration cache: {e}")
+
+
+def _extract_json_string(buf, key):
+    """
+    Pull a completed string value for `key` out of partially streamed JSON.
+    Returns the decoded string, or None if the value hasn't fully arrived.
+    """
+    m = re.search(r'"%s"\s*:\s*"' % re.escape(key), buf)
+    if not m:
+        return None
+    i = m.end()
+    while i < len(buf):
+        c = buf[i]
+        if c == '\\':
+            if i + 1 >= len(buf):
+                return None  # escape sequence still incomplete
+            i += 2
+            continue
+        if c == '"':
+            try:
+                return json.loads(buf[m.end() - 1:i + 1])
+            except ValueError:
+                return None
+        i += 1
+    return None
+
+
+def generate_narration(action, content, use_cache=True, refresh_cache=False,
+                       on_intro=None):
+    """Ask Qwen to generate Bob Ross style narration. Returns dict or fallback.
+
+    Results are cached on disk keyed by (model, action, content), so repeat
+    requests skip Ollama entirely. The response is streamed; if `on_intro`
+    is given it is called with the intro text the moment it has fully
+    decoded, while commentary and outro are still being generated."""
+    cache_path = _narration_cache_path(action, content)
+    if use_cache and not refresh_cache:
+        cached = _load_cached_narration(cache_path)
+        if cached:
+            print("  💾 Narration cache hit")
+            return cached
     if action == "write":
         text_lines = content.replace('\\n', '\n').split('\n')
         text_lines = [l for l in text_lines if l.strip()]
@@ -174,27 +425,35 @@ def generate_narration(action, content):
         "Respond with ONLY the JSON object. No explanation, no markdown."
     )
 
-    payload = json.dumps({
+    payload = _json_dumps({
         "model": OLLAMA_MODEL,
         "prompt": prompt,
-        "stream": False,
+        "stream": True,
         "format": "json",
-    }).encode()
+    })
 
     try:
-        req = urllib.request.Request(
-            OLLAMA_URL,
-            data=payload,
-            headers={"Content-Type": "application/json"},
-            method="POST",
-        )
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            result = json.loads(resp.read())
-            narration = json.loads(result["response"])
-            # Validate expected keys
-            if all(k in narration for k in ("intro", "commentary", "outro")):
-                return narration
-            print("  ⚠  Qwen response missing expected keys, using fallback")
+        resp = _ollama_stream("POST", "/api/generate", body=payload)
+        pieces = []
+        intro_sent = False
+        for raw_line in resp:
+            chunk = _json_loads(raw_line)
+            pieces.append(chunk.get("response", ""))
+            if on_intro and not intro_sent:
+                intro = _extract_json_string("".join(pieces), "intro")
+                if intro is not None:
+                    on_intro(intro)
+                    intro_sent = True
+            if chunk.get("done"):
+                break
+        resp.close()  # dedicated socket, nothing to keep alive
+        narration = _json_loads("".join(pieces))
+        # Validate expected keys
+        if all(k in narration for k in ("intro", "commentary", "outro")):
+            if use_cache:
+                _save_cached_narration(cache_path, narration)
+            return narration
+        print("  ⚠  Qwen response missing expected keys, using fallback")
     except Exception as e:
         print(f"  ⚠  Ollama error: {e} — using fallback narration")
 
@@ -218,24 +477,100 @@ def generate_narration(action, content):
     }
 
 
-# ── Commentary thread ─────────────────────────────────────────────────────────
-def run_commentary(phrases, draw_done):
-    """Fire commentary phrases at intervals while drawing. Runs in background thread."""
-    time.sleep(3)  # give the arm a moment to start
+# ── Commentary threads ────────────────────────────────────────────────────────
+# Bounded queue between the pacer (decides when the next phrase is due) and
+# the speaker (blocks in speak). Keeping them separate means a finished draw
+# stops the flow of phrases immediately instead of after a full sleep slot.
+_phrase_q = queue.Queue(maxsize=2)
+
+
+def pace_commentary(phrases, draw_done):
+    """Feed phrases into the queue at intervals while the draw runs."""
+    draw_done.wait(timeout=3)  # give the arm a moment to start
     for phrase in phrases:
         if stop_flag.is_set() or draw_done.is_set():
             break
-        speak(phrase)
+        try:
+            _phrase_q.put_nowait(phrase)
+        except queue.Full:
+            pass  # speech is behind — drop rather than stack stale phrases
         draw_done.wait(timeout=COMMENTARY_INTERVAL)
+    _phrase_q.put(None)  # stop sentinel
+
+
+def run_commentary():
+    """Speak queued commentary phrases until the stop sentinel arrives."""
+    while True:
+        phrase = _phrase_q.get()
+        if phrase is None:
+            break
+        speak(phrase)
 
 
 # ── Drawing ───────────────────────────────────────────────────────────────────
-def run_draw(action, content, size=None):
+def run_draw(action, content, size=None, isolated=False):
     """
-    Launch the appropriate huenit script as a subprocess.
+    Execute the draw in-process over the persistent serial handle (default),
+    or as a subprocess with `isolated=True`.
     Monitors stop_flag and terminates + lifts pen if set.
     Returns True on success.
     """
+    if isolated:
+        return _run_draw_subprocess(action, content, size)
+
+    result = {}
+
+    # Import before spawning: if this fails (missing pyserial, path
+    # problem) the worker would die without setting result or waking us,
+    # and run_draw would block forever. Failing here reports False, like
+    # the subprocess path's nonzero exit.
+    try:
+        hd = _huenit_module("huenit_draw")
+    except Exception as e:
+        print(f"  ⚠  Draw failed: {e}")
+        return False
+
+    def _worker():
+        try:
+            g = _get_gcode_io()
+            if action == "write":
+                hw = _huenit_module("huenit_write")
+                hw.run_write(content, g, size=size or 10.0)
+            elif action == "draw":
+                hd.run_shape(content, size, g)
+            elif action == "svg":
+                hs = _huenit_module("huenit_svg")
+                kwargs = {"size": size} if size else {}
+                hs.run_svg(content, g, **kwargs)
+            else:
+                print(f"  ⚠  Unknown action: {action}")
+                result["ok"] = False
+                return
+            result["ok"] = True
+        except hd.DrawAborted:
+            print("  ✋ Draw aborted — motion stream stopped")
+            result["ok"] = False
+        except Exception as e:
+            print(f"  ⚠  Draw failed: {e}")
+            result["ok"] = False
+        finally:
+            _draw_wake.set()
+
+    _draw_wake.clear()
+    t = threading.Thread(target=_worker, daemon=True)
+    t.start()
+    while True:
+        _draw_wake.wait()
+        if stop_flag.is_set() and "ok" not in result:
+            _emergency_stop(worker=t)
+            return False
+        if "ok" in result:
+            return result["ok"]
+        _draw_wake.clear()
+
+
+def _run_draw_subprocess(action, content, size=None):
+    """Subprocess fallback (--isolated): one python3 + serial open per job."""
     global _draw_proc
 
     if action == "write":
@@ -256,21 +591,31 @@ def run_draw(action, content, size=None):
 
     with _draw_proc_lock:
         _draw_proc = subprocess.Popen(cmd)
+    proc = _draw_proc
+
+    def _reap():
+        proc.wait()
+        _draw_wake.set()
+
+    _draw_wake.clear()
+    threading.Thread(target=_reap, daemon=True).start()
 
     try:
-        while _draw_proc.poll() is None:
-            if stop_flag.is_set():
+        while True:
+            _draw_wake.wait()
+            if stop_flag.is_set() and proc.poll() is None:
                 _emergency_stop()
                 return False
-            time.sleep(0.1)
-        return _draw_proc.returncode == 0
+            if proc.poll() is not None:
+                return proc.returncode == 0
+            _draw_wake.clear()
     finally:
         with _draw_proc_lock:
             _draw_proc = None
 
 
-def _emergency_stop():
-    """Terminate the draw process and lift the pen."""
+def _emergency_stop(worker=None):
+    """Stop the draw (worker thread or subprocess) and lift the pen."""
     global _draw_proc
     with _draw_proc_lock:
         proc = _draw_proc
@@ -278,6 +623,30 @@ def _emergency_stop():
         proc.terminate()
         proc.wait(timeout=3)
 
+    # Lift pen on the already-open handle if we have one — raw writes,
+    # bypassing the ok-accounting queue: the firmware may be mid-stream
+    # and a queued send could block on buffer space we'll never get.
+    if _gcode_io is not None:
+        # The streamer is single-writer: stop the in-process worker
+        # before touching the port so raw bytes can't interleave with a
+        # live stream. abort() makes its next send/wait raise.
+        _gcode_io.abort()
+        if worker is not None:
+            worker.join(timeout=3)
+        try:
+            # "!" is the grbl realtime feed hold — it halts buffered
+            # planner motion immediately; firmwares without it just ack
+            # the unknown line. Then a relative lift. No G90 here: the
+            # session's modal state is G91, and flipping it during an
+            # emergency risks any straggler delta being executed as an
+            # absolute lunge — close() restores absolute mode later.
+            _gcode_io.ser.write(b"!\nG91\nG1 Z5 F1200\nM400\n")
+            _gcode_io.ser.flush()
+            print("  ✅ Pen lifted — arm safe.")
+            return
+        except Exception as e:
+            print(f"  ⚠  Could not lift pen on open handle: {e}")
+
     # Lift pen via raw serial
     try:
         import serial
@@ -298,6 +667,8 @@ def _emergency_stop():
 def handle_stop(signum, frame):
     log("STOP", "signal received — aborting job")
     stop_flag.set()
+    _draw_wake.set()       # wake run_draw immediately instead of at next poll
+    _speak_client.close()  # unblock any phrase waiting on the daemon
 
 
 # ── Main ──────────────────────────────────────────────────────────────────────
@@ -315,11 +686,45 @@ def main():
     )
     parser.add_argument("--size", type=float, help="Size in mm (letter height or shape size)")
     parser.add_argument("--no-voice", action="store_true", help="Skip all voice narration")
+    parser.add_argument("--isolated", action="store_true",
+                        help="Run each draw as a subprocess instead of in-process")
+    parser.add_argument("--no-cache", action="store_true", help="Bypass the narration cache")
+    parser.add_argument("--refresh-cache", action="store_true",
+                        help="Regenerate narration and overwrite the cached entry")
     args = parser.parse_args()
 
     signal.signal(signal.SIGINT, handle_stop)
     signal.signal(signal.SIGTERM, handle_stop)
 
+    # ── PRE-WARM NARRATION ────────────────────────────────────────────────────
+    # Kick off the (slow) Qwen call immediately so it overlaps the readiness
+    # check and warning tone — total wait becomes max() instead of sum().
+    narration_result = {}
+    intro_ready = threading.Event()
+
+    def _on_intro(text):
+        narration_result["intro"] = text
+        intro_ready.set()
+
+    def _prewarm_narration():
+        narration = generate_narration(
+            args.action, args.content,
+            use_cache=not args.no_cache,
+            refresh_cache=args.refresh_cache,
+            on_intro=_on_intro,
+        )
+        narration_result["narration"] = narration
+        # Cache hits and fallbacks skip the streaming callback — publish
+        # their intro here so the main flow never waits the full timeout.
+        narration_result.setdefault("intro", narration.get("intro", ""))
+        intro_ready.set()
+
+    narration_thread = None
+    if args.action in ("write", "draw", "svg") and args.content and not args.no_voice:
+        log("NARRATION", "pre-warming in background")
+        narration_thread = threading.Thread(target=_prewarm_narration, daemon=True)
+        narration_thread.start()
+
     # ── READINESS CHECK ───────────────────────────────────────────────────────
     print("[robot-ross] Checking system readiness...")
     issues = readiness_check()
@@ -354,15 +759,6 @@ def main():
 
     log("JOB START", f"action={args.action} content={args.content!r}" + (f" size={args.size}" if args.size else ""))
 
-    # ── GENERATE NARRATION ────────────────────────────────────────────────────
-    if not args.no_voice:
-        log("NARRATION", "requesting from Qwen")
-        narration = generate_narration(args.action, args.content)
-        log("NARRATION", "ready" if narration.get("intro") else "using fallback")
-    else:
-        narration = {"intro": "", "commentary": [], "outro": ""}
-        log("NARRATION", "skipped (--no-voice)")
-
     if stop_flag.is_set():
         return
 
@@ -374,10 +770,25 @@ def main():
         log("STOP", "aborted during warning tone")
         return
 
-    # ── INTRO ─────────────────────────────────────────────────────────────────
-    if not args.no_voice and narration["intro"]:
-        log("VOICE INTRO", narration["intro"])
-        speak(narration["intro"])
+    # ── INTRO (spoken as soon as it has streamed in) ──────────────────────────
+    if narration_thread is not None:
+        intro_ready.wait(timeout=60)
+        intro = narration_result.get("intro", "")
+        if intro and not stop_flag.is_set():
+            log("VOICE INTRO", intro)
+            speak(intro)
+
+        # Commentary/outro usually finish generating while the intro plays.
+        narration_thread.join(timeout=60)
+        narration = narration_result.get("narration")
+        if narration is None:
+            log("NARRATION", "generation timed out — continuing without narration")
+            narration = {"intro": "", "commentary": [], "outro": ""}
+        else:
+            log("NARRATION", "ready" if narration.get("intro") else "using fallback")
+    else:
+        narration = {"intro": "", "commentary": [], "outro": ""}
+        log("NARRATION", "skipped (--no-voice)")
 
     if stop_flag.is_set():
         log("STOP", "aborted during intro")
@@ -390,14 +801,14 @@ def main():
     draw_done = threading.Event()
 
     if not args.no_voice and narration["commentary"]:
-        t = threading.Thread(
-            target=run_commentary,
+        threading.Thread(target=run_commentary, daemon=True).start()
+        threading.Thread(
+            target=pace_commentary,
             args=(narration["commentary"], draw_done),
             daemon=True,
-        )
-        t.start()
+        ).start()
 
-    success = run_draw(args.action, args.content, args.size)
+    success = run_draw(args.action, args.content, args.size, isolated=args.isolated)
     draw_done.set()
     elapsed = round(time.time() - draw_start, 1)
 
@@ -419,6 +830,7 @@ def main():
 
     status = "success" if success else "failed"
     log("JOB END", f"status={status} duration={elapsed}s")
+    _close_gcode_io()
 
 
 if __name__ == "__main__":
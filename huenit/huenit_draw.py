@@ -14,7 +14,8 @@ The drawing plane is X/Y. Z controls pen up/down.
 Calibrate first to find your Z_DOWN (pen touches paper) and Z_UP (pen lifted).
 """
 
-import sys, os, time, re, math, threading, json
+import sys, os, time, math, json, functools, select, selectors
+from collections import deque
 import serial
 
 # ── Config ────────────────────────────────────────────────────────────────────
@@ -22,7 +23,14 @@ PORT = os.environ.get("HUENIT_PORT", "/dev/cu.usbserial-310")
 BAUD = 115200
 DRAW_FEED = 400       # mm/min while drawing (slow for pen quality)
 TRAVEL_FEED = 800     # mm/min while pen is up (moving between shapes)
-CIRCLE_SEGMENTS = 72  # line segments to approximate a circle
+MAX_CHORD_MM = 0.5    # target chord length of a circle segment
+MIN_CIRCLE_SEGMENTS = 24  # floor so tiny circles still look round
+RX_BUFFER = 120       # bytes of firmware serial RX buffer we allow in flight
+                      # (grbl-style character counting; controller has 128)
+Z_FUSE_OK = True      # firmware blends G0 X/Y/Z into one move; set False if
+                      # your build forces Z moves to sync on their own
+SUPPORTS_ARC = True   # firmware accepts G2/G3 arcs; override via calibration
+                      # file ("supports_arc": false) if your build lacks them
 
 # Z heights — override via calibration file
 Z_UP = 5.0            # mm above paper (pen lifted)
@@ -32,8 +40,6 @@ TILT_SLOPE = 0.0      # mm of Z correction per mm of Y travel (from tilt calibra
 CALIBRATION_FILE = os.path.join(os.path.dirname(__file__), "calibration.json")
 READY_FLAG = "/tmp/huenit_ready.flag"
 
-OK_PAT = re.compile(rb"\bok\b", re.I)
-
 
 def check_ready():
     if not os.path.exists(READY_FLAG):
@@ -43,48 +49,244 @@ def check_ready():
 
 
 # ── Serial / G-code ──────────────────────────────────────────────────────────
+def _set_low_latency(ser):
+    """
+    Shrink the USB-serial adapter's latency timer (FTDI/CH340 default is
+    16 ms, so every firmware `ok` can sit in the adapter for up to a full
+    period before the RX thread sees it — that dwarfs the actual transfer
+    time on each drain/M400 round trip). Best effort: not every adapter
+    or driver exposes the knob, so failures are silent.
+    """
+    try:
+        # pyserial >= 3.5 wraps the Linux ioctl itself
+        ser.set_low_latency_mode(True)
+        return
+    except Exception:
+        pass
+    try:
+        import fcntl, array, struct
+        fd = ser.fileno()
+        if sys.platform == "darwin":
+            IOSSDATALAT = 0x80085400  # _IOW('T', 0, unsigned long), µs
+            fcntl.ioctl(fd, IOSSDATALAT, struct.pack("Q", 1000))
+        else:
+            TIOCGSERIAL, TIOCSSERIAL = 0x541E, 0x541F
+            ASYNC_LOW_LATENCY = 1 << 13
+            buf = array.array("i", [0] * 64)
+            fcntl.ioctl(fd, TIOCGSERIAL, buf)
+            buf[4] |= ASYNC_LOW_LATENCY  # serial_struct.flags
+            fcntl.ioctl(fd, TIOCSSERIAL, buf)
+    except Exception:
+        pass
+    try:
+        # FTDI drivers that ignore the flag still honor the sysfs timer
+        tty = os.path.basename(ser.port or "")
+        if tty:
+            with open(f"/sys/bus/usb-serial/devices/{tty}/latency_timer", "w") as f:
+                f.write("1")
+    except OSError:
+        pass
+
+
+class DrawAborted(Exception):
+    """Raised out of the send paths once GCodeIO.abort() has been called,
+    so a worker thread mid-stream unwinds instead of queuing more motion."""
+
+
 class GCodeIO:
+    """
+    Character-counting G-code streamer (grbl style).
+
+    Lines are queued into the firmware's serial RX buffer without waiting for
+    an individual `ok` per line; we only track how many bytes are in flight
+    and pop one queued length per `ok` the firmware sends back. This keeps
+    the motion planner fed so the arm never stalls between short segments.
+
+    All I/O runs on the caller's thread: acks are folded in
+    opportunistically before each send, and a selector blocks on the
+    serial fd only when the sender genuinely has to wait (window full,
+    drain, M400). No reader thread, no lock, no GIL hand-offs per line.
+    """
+
     def __init__(self, port, baud):
-        self.ser = serial.Serial(port, baud, timeout=0.05)
+        # timeout=0 (non-blocking reads): the selector supplies the
+        # blocking, reads just collect what the kernel already has.
+        # dsrdtr/rtscts stay off so opening never toggles DTR into a
+        # controller reset (~2 s on FTDI adapters).
+        self.ser = serial.Serial(port, baud, timeout=0,
+                                 dsrdtr=False, rtscts=False)
+        _set_low_latency(self.ser)
+        self._fd = self.ser.fileno()
+        self.sel = selectors.DefaultSelector()
+        self.sel.register(self._fd, selectors.EVENT_READ)
         self.buf = bytearray()
-        self.lock = threading.Lock()
-        self._rx = threading.Thread(target=self._rx_loop, daemon=True)
-        self._rx.start()
-
-    def _rx_loop(self):
-        while self.ser.is_open:
+        self.pending = deque()  # byte lengths of sent lines awaiting their ok
+        self._scanned = 0       # buf offset already searched for "ok"
+        self._modes = set()     # modal codes (G21/G90/G91...) already active
+        self._moved = False     # motion streamed since the last M400 sync
+        self._abort = False     # set from another thread to stop the stream
+
+    def abort(self):
+        """Request abort from another thread: every subsequent send or
+        wait on the streaming thread raises DrawAborted. The caller owns
+        any cleanup motion (feed hold, pen lift) once the stream stops."""
+        self._abort = True
+
+    def _write(self, data):
+        """TX straight to the fd, skipping pyserial's per-call bookkeeping.
+
+        There is exactly one writer (all I/O is on the caller's thread),
+        so no lock is needed. The fd is non-blocking; a full kernel TX
+        buffer or a short tty write just means waiting for writability
+        and sending the rest — with ~120-byte payloads that is rare."""
+        n = 0
+        while n < len(data):
             try:
-                n = self.ser.in_waiting
-                if n:
-                    d = self.ser.read(n)
-                    if d:
-                        with self.lock:
-                            self.buf.extend(d)
-                else:
-                    time.sleep(0.005)
-            except:
-                break
+                n += os.write(self._fd, data[n:])
+            except BlockingIOError:
+                select.select([], [self._fd], [])
+
+    def _poll_acks(self):
+        """Fold in whatever the kernel has buffered, without waiting."""
+        n = self.ser.in_waiting
+        if n:
+            # Firmware acks are lowercase "ok"; normalize so the byte
+            # scan below never misses a noisy "OK".
+            self.buf.extend(self.ser.read(n).lower())
+            self._consume_oks()
+
+    def _wait_for(self, predicate, timeout, what):
+        """Pump serial RX through the selector until predicate() holds."""
+        deadline = time.monotonic() + timeout
+        while not predicate():
+            if self._abort:
+                raise DrawAborted(what)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                print(f"  ⚠ timeout {what}")
+                self.pending.clear()
+                return False
+            # Cap each select so an abort() from another thread is seen
+            # within a beat even when the firmware has gone quiet.
+            if self.sel.select(min(remaining, 0.2)):
+                self._poll_acks()
+        return True
+
+    def _consume_oks(self):
+        """Pop one pending line per `ok` token.
+
+        Plain bytes.find resuming from the last scanned offset — no regex,
+        and no re-scanning of bytes already searched."""
+        while True:
+            idx = self.buf.find(b"ok", self._scanned)
+            if idx < 0:
+                # Keep the final byte in range: an "ok" may be split
+                # across two serial reads.
+                self._scanned = max(0, len(self.buf) - 1)
+                return
+            del self.buf[:idx + 2]
+            self._scanned = 0
+            if self.pending:
+                self.pending.popleft()
+
+    def send_async(self, line, timeout=10.0):
+        """
+        Stream a line into the firmware planner without waiting for its ok.
+        Blocks only while the firmware RX buffer has no room for it.
+        Accepts str, or newline-terminated bytes a hot loop pre-encoded.
+        No per-line flush: tcdrain blocks until the UART empties, which
+        would defeat the pipelining — close() drains once at the end.
+        """
+        if self._abort:
+            raise DrawAborted(line)
+        if isinstance(line, bytes):
+            data = line
+        else:
+            data = line.strip().encode("ascii", "ignore") + b"\n"
+        if data[2:3] == b" " and data[:2] in (b"G0", b"G1", b"G2", b"G3"):
+            self._moved = True
+        self._poll_acks()
+        self._wait_for(lambda: sum(self.pending) + len(data) <= RX_BUFFER,
+                       timeout, f"waiting for buffer space on: {line}")
+        self.pending.append(len(data))
+        self._write(data)
+
+    def send_many(self, lines, timeout=10.0):
+        """
+        Stream a batch of lines with as few write syscalls as possible.
+        Consecutive lines the firmware RX buffer has room for are packed
+        into a single ser.write; we only stop to wait for acks when the
+        window is full. A long polyline costs a handful of writes
+        instead of one kernel transition per segment.
+        """
+        batch = bytearray()
+        self._moved = self._moved or bool(lines)  # batches are always moves
+        for line in lines:
+            if self._abort:
+                raise DrawAborted(line)
+            if isinstance(line, bytes):
+                data = line
+            else:
+                data = line.strip().encode("ascii", "ignore") + b"\n"
+            self._poll_acks()
+            # pending already includes every line queued into batch, so
+            # the batch must not be counted again here.
+            if sum(self.pending) + len(data) > RX_BUFFER:
+                if batch:
+                    self._write(batch)
+                    batch = bytearray()
+                self._wait_for(
+                    lambda: sum(self.pending) + len(data) <= RX_BUFFER,
+                    timeout, "waiting for buffer space in batch")
+            self.pending.append(len(data))
+            batch += data
+        if batch:
+            self._write(batch)
+
+    def drain(self, timeout=30.0):
+        """Wait until every streamed line has been acknowledged."""
+        self._poll_acks()
+        self._wait_for(lambda: not self.pending, timeout,
+                       "draining streamed G-code")
 
     def send(self, line, wait_ok=True, timeout=10.0):
-        self.ser.write((line.strip() + "\n").encode("ascii", "ignore"))
-        self.ser.flush()
-        if not wait_ok:
+        """Send a line; with wait_ok, block until the firmware has acked it
+        (and everything streamed before it)."""
+        self.send_async(line, timeout=timeout)
+        if wait_ok:
+            self.drain(timeout=timeout)
+
+    def set_modes(self, *modes):
+        """
+        Activate modal G-codes (G21, G90/G91, ...). Modes already active
+        are skipped and the rest go out fused on one line, so a repeated
+        session preamble costs zero round trips instead of one per code.
+        """
+        new = [m for m in modes if m not in self._modes]
+        if not new:
             return
-        t0 = time.time()
-        while time.time() - t0 < timeout:
-            time.sleep(0.01)
-            with self.lock:
-                if OK_PAT.search(self.buf):
-                    self.buf.clear()
-                    return
-        print(f"  ⚠ timeout waiting for ok on: {line}")
+        for m in new:
+            # G90/G91 are mutually exclusive; activating one ends the other.
+            self._modes.discard({"G90": "G91", "G91": "G90"}.get(m))
+            self._modes.add(m)
+        self.send(" ".join(new), wait_ok=True)
 
     def wait_motion(self):
-        """Wait for all queued motion to complete."""
+        """Wait for all queued motion to complete.
+
+        A no-op when no motion has been streamed since the last sync —
+        M400 drains the whole planner pipeline, so redundant calls
+        (shape end right after a fused travel, say) shouldn't pay a
+        second full round trip for an already-idle machine."""
+        if not self._moved:
+            return
         self.send("M400", wait_ok=True, timeout=30.0)
+        self._moved = False
 
     def close(self):
         try:
+            self.sel.close()
+            self.ser.flush()  # one tcdrain for the whole session
             self.ser.close()
         except:
             pass
@@ -92,82 +294,220 @@ class GCodeIO:
 
 # ── Pen control ───────────────────────────────────────────────────────────────
 def pen_up(g):
+    """Lift the pen. Z moves serialize: drain streamed XY moves first."""
     print("  ✏️  pen UP")
-    g.send(f"G1 Z{Z_UP:.2f} F{TRAVEL_FEED}", wait_ok=True)
+    g.drain()
+    g.send_async(f"G1 Z{Z_UP:.2f} F{TRAVEL_FEED}")
     g.wait_motion()
 
 
 def pen_down(g):
+    """Lower the pen. Z moves serialize: drain streamed XY moves first."""
     print("  ✏️  pen DOWN")
-    g.send(f"G1 Z{-Z_UP:.2f} F{TRAVEL_FEED}", wait_ok=True)
+    g.drain()
+    g.send_async(f"G1 Z{-Z_UP:.2f} F{TRAVEL_FEED}")
     g.wait_motion()
 
 
-def _z_comp(dy):
+def _z_comp_active(dy):
     """Z compensation string for a Y move of dy mm."""
     dz = TILT_SLOPE * dy
     return f" Z{dz:.3f}" if abs(dz) > 0.001 else ""
 
 
+def _z_comp_flat(dy):
+    return ""
+
+
+# Rebound by load_calibration: on a level surface (tilt 0, the common
+# case) every move skips the multiply/compare/format entirely.
+_z_comp = _z_comp_flat
+
+
 def move_to(g, x, y):
-    """Relative travel move (pen should be up)."""
-    g.send(f"G1 X{x:.3f} Y{y:.3f}{_z_comp(y)} F{TRAVEL_FEED}", wait_ok=True)
+    """Relative travel move (pen should be up). Streamed into the planner."""
+    g.send_async(f"G1 X{x:.3f} Y{y:.3f}{_z_comp(y)} F{TRAVEL_FEED}")
+
+
+def travel_lift(g, x, y):
+    """
+    Lift the pen and travel in a single blended G0 (pen starts DOWN).
+    One planner segment instead of a full stop between Z lift and XY move.
+    """
+    if not Z_FUSE_OK:
+        pen_up(g)
+        move_to(g, x, y)
+        return
+    print("  ✏️  pen UP (fused travel)")
+    g.drain()
+    dz = Z_UP + TILT_SLOPE * y
+    g.send_async(f"G0 X{x:.3f} Y{y:.3f} Z{dz:.2f} F{TRAVEL_FEED}")
     g.wait_motion()
 
 
-def draw_to(g, x, y):
-    """Relative draw move (pen should be down)."""
-    g.send(f"G1 X{x:.3f} Y{y:.3f}{_z_comp(y)} F{DRAW_FEED}", wait_ok=True)
+def travel_drop(g, x, y):
+    """
+    Travel and lower the pen in a single blended G0 (pen starts UP).
+    Z decreases linearly along the move, so the pen only meets the paper
+    at the very end point.
+    """
+    if not Z_FUSE_OK:
+        move_to(g, x, y)
+        pen_down(g)
+        return
+    print("  ✏️  pen DOWN (fused travel)")
+    g.drain()
+    dz = -Z_UP + TILT_SLOPE * y
+    g.send_async(f"G0 X{x:.3f} Y{y:.3f} Z{dz:.2f} F{TRAVEL_FEED}")
     g.wait_motion()
 
 
+def draw_to(g, x, y):
+    """Relative draw move (pen should be down). Streamed into the planner."""
+    g.send_async(f"G1 X{x:.3f} Y{y:.3f}{_z_comp(y)} F{DRAW_FEED}")
+
+
+# ── Geometry helpers ──────────────────────────────────────────────────────────
+def rdp_keep(pts, eps):
+    """Ramer-Douglas-Peucker, iterative with an explicit stack.
+    Returns a keep-mask over pts. Shared by the SVG and text renderers
+    to collapse near-collinear chains before formatting G-code."""
+    keep = [False] * len(pts)
+    keep[0] = keep[-1] = True
+    eps2 = eps * eps
+    stack = [(0, len(pts) - 1)]
+    while stack:
+        a, b = stack.pop()
+        if b - a < 2:
+            continue
+        ax, ay = pts[a]
+        bx, by = pts[b]
+        dx, dy = bx - ax, by - ay
+        den = dx * dx + dy * dy
+        best_d2, best_i = -1.0, -1
+        for i in range(a + 1, b):
+            px, py = pts[i]
+            if den > 1e-18:
+                cross = (px - ax) * dy - (py - ay) * dx
+                d2 = cross * cross / den
+            else:
+                d2 = (px - ax) ** 2 + (py - ay) ** 2
+            if d2 > best_d2:
+                best_d2, best_i = d2, i
+        if best_d2 > eps2:
+            keep[best_i] = True
+            stack.append((a, best_i))
+            stack.append((best_i, b))
+    return keep
+
+
 # ── Shapes ────────────────────────────────────────────────────────────────────
-def draw_square(g, size=30.0):
+# Shapes are data: lists of relative (dx, dy, feed) moves built once per
+# (shape, size) and streamed uniformly — no geometry work in the send path.
+_SQRT3_2 = math.sqrt(3) / 2.0
+
+
+@functools.lru_cache(maxsize=16)
+def square_moves(size):
+    """Closed square starting at the bottom-left corner."""
+    return (
+        (size, 0.0, DRAW_FEED),
+        (0.0, size, DRAW_FEED),
+        (-size, 0.0, DRAW_FEED),
+        (0.0, -size, DRAW_FEED),
+    )
+
+
+@functools.lru_cache(maxsize=16)
+def triangle_moves(size):
+    """Closed equilateral triangle starting at the base-left corner."""
+    h = size * _SQRT3_2
+    return (
+        (size, 0.0, DRAW_FEED),        # base
+        (-size / 2, h, DRAW_FEED),     # up to apex
+        (-size / 2, -h, DRAW_FEED),    # back to start
+    )
+
+
+def draw_moves(g, moves):
+    """Stream a precomputed (dx, dy, feed) move list into the planner."""
+    for dx, dy, feed in moves:
+        g.send_async(f"G1 X{dx:.3f} Y{dy:.3f}{_z_comp(dy)} F{feed}")
+
+
+def draw_square(g, size=30.0, lift=True):
+    """With lift=False the pen stays down so the caller can fuse the lift
+    into the next travel move."""
     print(f"\n🟥 Drawing square ({size}mm)")
     pen_down(g)
-    draw_to(g, size, 0)
-    draw_to(g, 0, size)
-    draw_to(g, -size, 0)
-    draw_to(g, 0, -size)
-    pen_up(g)
+    draw_moves(g, square_moves(round(size, 3)))
+    if lift:
+        pen_up(g)
     print("  ✅ Square done")
 
 
-def draw_triangle(g, size=30.0):
-    """Equilateral triangle."""
+def draw_triangle(g, size=30.0, lift=True):
+    """Equilateral triangle. With lift=False the pen stays down so the
+    caller can fuse the lift into the next travel move."""
     print(f"\n🔺 Drawing triangle ({size}mm)")
-    h = size * math.sqrt(3) / 2
     pen_down(g)
-    draw_to(g, size, 0)           # base
-    draw_to(g, -size/2, h)        # up to apex
-    draw_to(g, -size/2, -h)       # back to start
-    pen_up(g)
+    draw_moves(g, triangle_moves(round(size, 3)))
+    if lift:
+        pen_up(g)
     print("  ✅ Triangle done")
 
 
-def draw_circle(g, radius=15.0):
-    """Circle approximated with line segments."""
-    print(f"\n⭕ Drawing circle (r={radius}mm)")
-    n = CIRCLE_SEGMENTS
-
-    # Move to start of circle (right side: +radius in X from center)
-    move_to(g, radius, 0)
-    pen_down(g)
+def _circle_lines(radius, n):
+    """
+    Precompute the fully formatted, encoded G-code lines for an n-segment
+    circle. All trig, string formatting, and encoding happens here, up
+    front, so the send loop is nothing but serial writes. Points use the
+    angle-addition recurrence — one sin/cos at setup, four multiplies
+    per step — with the final point snapped back onto the start.
+    """
+    c, s = math.cos(2 * math.pi / n), math.sin(2 * math.pi / n)
+    xs, ys = [radius], [0.0]
+    px, py = radius, 0.0
+    for _ in range(n):
+        px, py = c * px - s * py, s * px + c * py
+        xs.append(px)
+        ys.append(py)
+    xs[-1], ys[-1] = radius, 0.0
+    return [
+        f"G1 X{x1 - x0:.3f} Y{y1 - y0:.3f}{_z_comp(y1 - y0)} F{DRAW_FEED}\n".encode("ascii")
+        for x0, y0, x1, y1 in zip(xs, ys, xs[1:], ys[1:])
+    ]
+
+
+def draw_circle(g, radius=15.0, chord_mm=None):
+    """Circle as a single G2 arc when the firmware supports it, otherwise
+    approximated with line segments.
+
+    The arc is one serial command and lets the firmware interpolate at
+    full resolution. The segmented fallback adapts its count to the
+    radius: enough that no chord exceeds chord_mm, so small circles stop
+    wasting serial commands on detail they can't show and large ones
+    stop looking faceted. A non-zero tilt slope forces the fallback —
+    the firmware can't apply per-segment Z compensation inside an arc."""
+    use_arc = SUPPORTS_ARC and TILT_SLOPE == 0
+
+    # Move to start of circle (right side: +radius in X from center),
+    # lowering the pen on the way
+    travel_drop(g, radius, 0)
+
+    if use_arc:
+        # Full clockwise circle: endpoint = start point, center at I/J
+        # offset (-radius, 0) from where the pen sits.
+        print(f"\n⭕ Drawing circle (r={radius}mm, G2 arc)")
+        g.send_async(f"G2 X0 Y0 I{-radius:.3f} J0 F{DRAW_FEED}")
+    else:
+        chord = chord_mm or MAX_CHORD_MM
+        n = max(MIN_CIRCLE_SEGMENTS, math.ceil(2 * math.pi * radius / chord))
+        print(f"\n⭕ Drawing circle (r={radius}mm, {n} segments)")
+        g.send_many(_circle_lines(radius, n))
 
-    # Trace the circle
-    prev_x, prev_y = radius, 0.0
-    for i in range(1, n + 1):
-        angle = 2 * math.pi * i / n
-        cx = radius * math.cos(angle)
-        cy = radius * math.sin(angle)
-        dx = cx - prev_x
-        dy = cy - prev_y
-        draw_to(g, dx, dy)
-        prev_x, prev_y = cx, cy
-
-    pen_up(g)
-    # Move back to center
-    move_to(g, -radius, 0)
+    # Lift and return to center in one blended move
+    travel_lift(g, -radius, 0)
     print("  ✅ Circle done")
 
 
@@ -278,13 +618,34 @@ def calibrate(g):
                 pass  # will re-prompt
 
 
+@functools.lru_cache(maxsize=1)
+def _parse_calibration(mtime_ns):
+    with open(CALIBRATION_FILE) as f:
+        return json.load(f)
+
+
+def read_calibration():
+    """Parsed calibration dict, or None when not calibrated.
+
+    The JSON is parsed once per on-disk version: the cache is keyed by
+    the file's mtime, so batch callers looping over draws skip the
+    re-open + re-parse while a fresh calibrate run still invalidates it.
+    Shared by all three renderers' load_calibration."""
+    try:
+        mtime_ns = os.stat(CALIBRATION_FILE).st_mtime_ns
+    except OSError:
+        return None
+    return _parse_calibration(mtime_ns)
+
+
 def load_calibration():
-    global Z_UP, TILT_SLOPE
-    if os.path.exists(CALIBRATION_FILE):
-        with open(CALIBRATION_FILE) as f:
-            cal = json.load(f)
+    global Z_UP, TILT_SLOPE, SUPPORTS_ARC, _z_comp
+    cal = read_calibration()
+    if cal is not None:
         Z_UP        = cal.get("z_up", Z_UP)
         TILT_SLOPE  = cal.get("tilt_slope", 0.0)
+        SUPPORTS_ARC = cal.get("supports_arc", SUPPORTS_ARC)
+        _z_comp     = _z_comp_flat if TILT_SLOPE == 0.0 else _z_comp_active
         tilt_info   = f", tilt={TILT_SLOPE:.4f} mm/mm" if TILT_SLOPE != 0 else ", no tilt"
         print(f"  📐 Loaded calibration: Z_UP = {Z_UP:.1f}mm{tilt_info}")
     else:
@@ -292,75 +653,106 @@ def load_calibration():
         print(f"     Run 'python3 huenit_draw.py calibrate' to calibrate.")
 
 
+# ── Entry points ──────────────────────────────────────────────────────────────
+def run_shape(cmd, size, g, chord_mm=None):
+    """
+    Draw a named shape on an already-open GCodeIO (G21/G91 must be set).
+    Lets callers (bob_ross.py) reuse one serial connection across shapes
+    instead of paying a DTR reset per subprocess. Raises ValueError on an
+    unknown shape name.
+    """
+    load_calibration()
+
+    if cmd == "square":
+        s = size or 30.0
+        move_to(g, -s / 2, -s / 2)          # center: shift to bottom-left corner
+        draw_square(g, s, lift=False)         # ends back at bottom-left corner, pen down
+        travel_lift(g, s / 2, s / 2)         # lift + return to center, one move
+        g.drain()
+        g.wait_motion()
+        print("\n  ✅ Done! (pen is up — safe to remove paper)")
+
+    elif cmd == "triangle":
+        s = size or 30.0
+        move_to(g, -s / 2, 0)               # center horizontally (base centered)
+        draw_triangle(g, s, lift=False)       # ends back at base-left, pen down
+        travel_lift(g, s / 2, 0)            # lift + return to center, one move
+        g.drain()
+        g.wait_motion()
+        print("\n  ✅ Done! (pen is up — safe to remove paper)")
+
+    elif cmd == "circle":
+        draw_circle(g, size or 15.0, chord_mm)  # already centered around start point, pen up
+        g.drain()
+        g.wait_motion()
+        print("\n  ✅ Done! (pen is up — safe to remove paper)")
+
+    elif cmd == "demo":
+        s = size or 25.0
+        # Square (centered)
+        move_to(g, -s / 2, -s / 2)
+        draw_square(g, s, lift=False)
+        travel_lift(g, s / 2 + 35, s / 2)   # lift + over to next shape, one move
+        # Triangle (centered)
+        move_to(g, -s / 2, 0)
+        draw_triangle(g, s, lift=False)
+        travel_lift(g, s / 2 + 35, 0)       # lift + over to next shape, one move
+        # Circle (already centered)
+        r = size or 12.0
+        draw_circle(g, r, chord_mm)
+        # Return to original start
+        move_to(g, -(70 + r), 0)
+        g.drain()
+        g.wait_motion()
+        print("\n🎨 Demo complete! (pen is up — safe to remove paper)")
+
+    else:
+        raise ValueError(f"Unknown command: {cmd}")
+
+
 # ── Main ──────────────────────────────────────────────────────────────────────
 def main():
-    if len(sys.argv) < 2:
-        print("Usage: python3 huenit_draw.py <command> [size]")
+    args = sys.argv[1:]
+
+    chord_mm = None
+    if "--chord-mm" in args:
+        i = args.index("--chord-mm")
+        chord_mm = float(args[i + 1])
+        del args[i:i + 2]
+
+    if not args:
+        print("Usage: python3 huenit_draw.py <command> [size] [--chord-mm N]")
         print("  calibrate           Interactive pen-down calibration")
         print("  square [size_mm]    Draw a square (default 30)")
         print("  triangle [size_mm]  Draw a triangle (default 30)")
         print("  circle [radius_mm]  Draw a circle (default 15)")
         print("  demo                Draw all three shapes in a row")
+        print(f"  --chord-mm N        Max circle chord length (default {MAX_CHORD_MM})")
         sys.exit(0)
 
-    cmd = sys.argv[1].lower()
-    size = float(sys.argv[2]) if len(sys.argv) > 2 else None
+    cmd = args[0].lower()
+    size = float(args[1]) if len(args) > 1 else None
 
     print(f"HUENIT Draw — Port: {PORT}")
 
     g = GCodeIO(PORT, BAUD)
     try:
-        g.send("G21", wait_ok=True)  # metric
-        g.send("G91", wait_ok=True)  # relative
+        g.set_modes("G21", "G91")  # metric, relative — one line, one ok
 
         if cmd == "calibrate":
             calibrate(g)
             return
 
         check_ready()
-        load_calibration()
-
-        if cmd == "square":
-            s = size or 30.0
-            move_to(g, -s / 2, -s / 2)          # center: shift to bottom-left corner
-            draw_square(g, s)                     # ends back at bottom-left corner, pen up
-            move_to(g, s / 2, s / 2)             # return to original center
-            print("\n  ✅ Done! (pen is up — safe to remove paper)")
-
-        elif cmd == "triangle":
-            s = size or 30.0
-            move_to(g, -s / 2, 0)               # center horizontally (base centered)
-            draw_triangle(g, s)                   # ends back at base-left, pen up
-            move_to(g, s / 2, 0)                # return to original center
-            print("\n  ✅ Done! (pen is up — safe to remove paper)")
-
-        elif cmd == "circle":
-            draw_circle(g, size or 15.0)          # already centered around start point, pen up
-            print("\n  ✅ Done! (pen is up — safe to remove paper)")
-
-        elif cmd == "demo":
-            s = size or 25.0
-            # Square (centered)
-            move_to(g, -s / 2, -s / 2)
-            draw_square(g, s)
-            move_to(g, s / 2 + 35, s / 2)       # back to center then right to next shape
-            # Triangle (centered)
-            move_to(g, -s / 2, 0)
-            draw_triangle(g, s)
-            move_to(g, s / 2 + 35, 0)           # back to center then right to next shape
-            # Circle (already centered)
-            r = size or 12.0
-            draw_circle(g, r)
-            # Return to original start
-            move_to(g, -(70 + r), 0)
-            print("\n🎨 Demo complete! (pen is up — safe to remove paper)")
 
-        else:
-            print(f"Unknown command: {cmd}")
+        try:
+            run_shape(cmd, size, g, chord_mm)
+        except ValueError as e:
+            print(e)
             sys.exit(1)
 
     finally:
-        g.send("G90", wait_ok=True)
+        g.set_modes("G90")
         g.close()
 
 
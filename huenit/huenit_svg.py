@@ -12,14 +12,21 @@ Usage:
 Supported SVG elements: <path>, <circle>, <ellipse>, <rect>, <line>,
                          <polyline>, <polygon>
 All shapes should be on a flat layer (no nested transforms).
-Bezier curves are approximated with line segments (CURVE_STEPS).
+Bezier curves are flattened adaptively to a FLATTEN_TOL_MM tolerance.
 
 Requires prior calibration: python3 huenit_draw.py calibrate
 """
 
-import sys, os, re, math, time, threading, argparse, json
-import xml.etree.ElementTree as ET
-import serial
+import sys, os, re, math, argparse, json
+
+try:
+    # Optional: lxml parses large SVGs several times faster. The stdlib
+    # parser handles the same subset, just slower.
+    from lxml import etree as ET
+except ImportError:
+    import xml.etree.ElementTree as ET
+
+from huenit_draw import GCodeIO, rdp_keep, read_calibration
 
 # ── Config ────────────────────────────────────────────────────────────────────
 PORT          = os.environ.get("HUENIT_PORT", "/dev/cu.usbserial-310")
@@ -27,7 +34,8 @@ BAUD          = 115200
 TRAVEL_FEED   = 800
 DEFAULT_FEED  = 250    # slower than text for detail
 DEFAULT_SIZE  = 80.0   # mm, max dimension
-CURVE_STEPS   = 20     # line segments per bezier curve
+FLATTEN_TOL_MM = 0.1   # max chord deviation on paper when flattening curves
+SIMPLIFY_TOL_MM = 0.05  # max deviation when merging collinear segments
 CIRCLE_STEPS  = 48     # line segments per full circle/ellipse
 
 SCRIPT_DIR       = os.path.dirname(os.path.abspath(__file__))
@@ -37,8 +45,6 @@ READY_FLAG       = "/tmp/huenit_ready.flag"
 Z_UP        = 6.0
 TILT_SLOPE  = 0.0     # mm of Z correction per mm of Y travel (loaded from calibration)
 
-OK_PAT = re.compile(rb"\bok\b", re.I)
-
 
 def check_ready():
     if not os.path.exists(READY_FLAG):
@@ -47,92 +53,152 @@ def check_ready():
         sys.exit(1)
 
 
-# ── Serial / G-code ──────────────────────────────────────────────────────────
-class GCodeIO:
-    def __init__(self, port, baud):
-        self.ser = serial.Serial(port, baud, timeout=0.05)
-        self.buf = bytearray()
-        self.lock = threading.Lock()
-        self._rx = threading.Thread(target=self._rx_loop, daemon=True)
-        self._rx.start()
-
-    def _rx_loop(self):
-        while self.ser.is_open:
-            try:
-                n = self.ser.in_waiting
-                if n:
-                    d = self.ser.read(n)
-                    if d:
-                        with self.lock:
-                            self.buf.extend(d)
-                else:
-                    time.sleep(0.005)
-            except:
-                break
-
-    def send(self, line, wait_ok=True, timeout=10.0):
-        self.ser.write((line.strip() + "\n").encode("ascii", "ignore"))
-        self.ser.flush()
-        if not wait_ok:
-            return
-        t0 = time.time()
-        while time.time() - t0 < timeout:
-            time.sleep(0.01)
-            with self.lock:
-                if OK_PAT.search(self.buf):
-                    self.buf.clear()
-                    return
-        print(f"  ⚠ timeout waiting for ok on: {line}")
-
-    def wait_motion(self):
-        self.send("M400", wait_ok=True, timeout=60.0)
-
-    def close(self):
-        try:
-            self.ser.close()
-        except:
-            pass
-
-
 # ── Bezier helpers ────────────────────────────────────────────────────────────
-def cubic_bezier(p0, p1, p2, p3, steps):
+# Curves are flattened adaptively: subdivide by de Casteljau until the
+# control points sit within a tolerance of the chord. Straight-ish curves
+# emit a couple of segments, tight ones get the detail they need —
+# instead of a fixed 20 segments per curve regardless of shape.
+def flatten_cubic(p0, p1, p2, p3, tol, _depth=0):
+    """Flatten a cubic Bezier to line-segment endpoints (p0 excluded)."""
+    x0, y0 = p0
+    x1, y1 = p1
+    x2, y2 = p2
+    x3, y3 = p3
+    dx = x3 - x0
+    dy = y3 - y0
+    chord2 = dx * dx + dy * dy
+    if chord2 > 1e-18:
+        d1 = abs((x1 - x0) * dy - (y1 - y0) * dx)
+        d2 = abs((x2 - x0) * dy - (y2 - y0) * dx)
+        flat = (d1 + d2) * (d1 + d2) <= tol * tol * chord2
+    else:
+        # Degenerate chord (curve returns to its start): flat only if the
+        # control points collapse onto it too.
+        flat = max(abs(x1 - x0), abs(y1 - y0),
+                   abs(x2 - x0), abs(y2 - y0)) <= tol
+    if flat or _depth >= 18:
+        return [p3]
+    ax, ay = (x0 + x1) / 2, (y0 + y1) / 2
+    bx, by = (x1 + x2) / 2, (y1 + y2) / 2
+    cx, cy = (x2 + x3) / 2, (y2 + y3) / 2
+    abx, aby = (ax + bx) / 2, (ay + by) / 2
+    bcx, bcy = (bx + cx) / 2, (by + cy) / 2
+    mx, my = (abx + bcx) / 2, (aby + bcy) / 2
+    return (flatten_cubic(p0, (ax, ay), (abx, aby), (mx, my), tol, _depth + 1)
+            + flatten_cubic((mx, my), (bcx, bcy), (cx, cy), p3, tol, _depth + 1))
+
+
+def arc_to_lines(x1, y1, rx, ry, xrot_deg, large, sweep, x2, y2, tol):
+    """
+    Flatten an SVG elliptical arc to line-segment endpoints (start point
+    excluded). Converts the endpoint parameterization to center form per
+    the SVG spec (appendix F.6.5), then walks the sweep angle with the
+    same incremental-rotation recurrence the circle helpers use, with
+    the rx/ry scale and x-rotation applied per point from hoisted
+    constants. Step count keeps the chord sagitta within tol.
+    """
+    rx, ry = abs(rx), abs(ry)
+    if rx < 1e-9 or ry < 1e-9 or (abs(x2 - x1) < 1e-9 and abs(y2 - y1) < 1e-9):
+        return [(x2, y2)]
+
+    phi = math.radians(xrot_deg)
+    cp, sp = math.cos(phi), math.sin(phi)
+    dx2, dy2 = (x1 - x2) / 2, (y1 - y2) / 2
+    x1p = cp * dx2 + sp * dy2
+    y1p = -sp * dx2 + cp * dy2
+
+    # Scale radii up if they can't span the endpoints
+    lam = x1p * x1p / (rx * rx) + y1p * y1p / (ry * ry)
+    if lam > 1:
+        k = math.sqrt(lam)
+        rx *= k
+        ry *= k
+
+    num = rx * rx * ry * ry - rx * rx * y1p * y1p - ry * ry * x1p * x1p
+    den = rx * rx * y1p * y1p + ry * ry * x1p * x1p
+    co = math.sqrt(max(0.0, num / den)) if den > 0 else 0.0
+    if large == sweep:
+        co = -co
+    cxp = co * rx * y1p / ry
+    cyp = -co * ry * x1p / rx
+    ccx = cp * cxp - sp * cyp + (x1 + x2) / 2
+    ccy = sp * cxp + cp * cyp + (y1 + y2) / 2
+
+    theta1 = math.atan2((y1p - cyp) / ry, (x1p - cxp) / rx)
+    theta2 = math.atan2((-y1p - cyp) / ry, (-x1p - cxp) / rx)
+    dtheta = theta2 - theta1
+    if not sweep and dtheta > 0:
+        dtheta -= 2 * math.pi
+    elif sweep and dtheta < 0:
+        dtheta += 2 * math.pi
+
+    # Sagitta of a chord over step angle a is ~r*a^2/8: keep it under tol
+    r = max(rx, ry)
+    max_step = math.sqrt(8 * max(tol, 1e-6) / r)
+    n = max(2, math.ceil(abs(dtheta) / max_step))
+    d = dtheta / n
+    c, s = math.cos(d), math.sin(d)
+    ct, st = math.cos(theta1), math.sin(theta1)
     pts = []
-    for i in range(steps + 1):
-        t = i / steps
-        u = 1 - t
-        x = u**3*p0[0] + 3*u**2*t*p1[0] + 3*u*t**2*p2[0] + t**3*p3[0]
-        y = u**3*p0[1] + 3*u**2*t*p1[1] + 3*u*t**2*p2[1] + t**3*p3[1]
-        pts.append((x, y))
+    for _ in range(n - 1):
+        ct, st = c * ct - s * st, s * ct + c * st
+        ex, ey = rx * ct, ry * st
+        pts.append((ccx + cp * ex - sp * ey, ccy + sp * ex + cp * ey))
+    pts.append((x2, y2))  # land exactly on the endpoint
     return pts
 
 
-def quadratic_bezier(p0, p1, p2, steps):
-    pts = []
-    for i in range(steps + 1):
-        t = i / steps
-        u = 1 - t
-        x = u**2*p0[0] + 2*u*t*p1[0] + t**2*p2[0]
-        y = u**2*p0[1] + 2*u*t*p1[1] + t**2*p2[1]
-        pts.append((x, y))
-    return pts
+def flatten_quadratic(p0, p1, p2, tol, _depth=0):
+    """Flatten a quadratic Bezier to line-segment endpoints (p0 excluded)."""
+    x0, y0 = p0
+    x1, y1 = p1
+    x2, y2 = p2
+    dx = x2 - x0
+    dy = y2 - y0
+    chord2 = dx * dx + dy * dy
+    if chord2 > 1e-18:
+        d1 = abs((x1 - x0) * dy - (y1 - y0) * dx)
+        flat = d1 * d1 <= tol * tol * chord2
+    else:
+        flat = max(abs(x1 - x0), abs(y1 - y0)) <= tol
+    if flat or _depth >= 18:
+        return [p2]
+    ax, ay = (x0 + x1) / 2, (y0 + y1) / 2
+    bx, by = (x1 + x2) / 2, (y1 + y2) / 2
+    mx, my = (ax + bx) / 2, (ay + by) / 2
+    return (flatten_quadratic(p0, (ax, ay), (mx, my), tol, _depth + 1)
+            + flatten_quadratic((mx, my), (bx, by), p2, tol, _depth + 1))
 
 
 # ── SVG path parser ───────────────────────────────────────────────────────────
+_PATH_TOKEN_RE = re.compile(
+    r'([MmLlHhVvCcQqSsTtAaZz])|([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)'
+)
+
+
 def tokenize_path(d):
-    """Split path data into command letters and number strings."""
-    return re.findall(
-        r'[MmLlHhVvCcQqSsTtAaZz]|[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?',
-        d
-    )
+    """Split path data into (is_cmd, value) pairs.
 
+    Classification and float conversion both happen here, in one pass of
+    a precompiled regex: command letters stay strings, numbers come back
+    already converted, so the parser's number fetches are plain index
+    advances with no re-matching or float() calls."""
+    return [
+        (True, m.group()) if m.lastindex == 1 else (False, float(m.group()))
+        for m in _PATH_TOKEN_RE.finditer(d)
+    ]
 
-def parse_path_d(d):
+
+def parse_path_d(d, tol=FLATTEN_TOL_MM):
     """
     Parse SVG path d attribute.
     Returns list of ('move'|'line', x, y) in SVG coordinate space.
+    tol is the curve-flattening tolerance in SVG units.
     """
     tokens = tokenize_path(d)
+    n_tok = len(tokens)
     segments = []
+    append = segments.append   # bound once; the loop below is the hot path
     i = 0
     cmd = None
     cx, cy = 0.0, 0.0   # current position
@@ -143,16 +209,16 @@ def parse_path_d(d):
         nonlocal i
         result = []
         for _ in range(n):
-            if i < len(tokens) and re.match(r'[-+]?(?:\d+\.?\d*|\.\d+)', tokens[i]):
-                result.append(float(tokens[i]))
+            if i < n_tok and not tokens[i][0]:
+                result.append(tokens[i][1])
                 i += 1
             else:
                 result.append(0.0)
         return result
 
-    while i < len(tokens):
-        t = tokens[i]
-        if re.match(r'[MmLlHhVvCcQqSsTtAaZz]', t):
+    while i < n_tok:
+        is_cmd, t = tokens[i]
+        if is_cmd:
             cmd = t
             i += 1
             last_ctrl = None
@@ -165,7 +231,7 @@ def parse_path_d(d):
             x, y = next_nums(2)
             if cmd == 'm':
                 x += cx; y += cy
-            segments.append(('move', x, y))
+            append(('move', x, y))
             sx, sy = x, y
             cx, cy = x, y
             cmd = 'L' if cmd == 'M' else 'l'
@@ -174,21 +240,21 @@ def parse_path_d(d):
             x, y = next_nums(2)
             if cmd == 'l':
                 x += cx; y += cy
-            segments.append(('line', x, y))
+            append(('line', x, y))
             cx, cy = x, y
 
         elif cmd in ('H', 'h'):
             x, = next_nums(1)
             if cmd == 'h':
                 x += cx
-            segments.append(('line', x, cy))
+            append(('line', x, cy))
             cx = x
 
         elif cmd in ('V', 'v'):
             y, = next_nums(1)
             if cmd == 'v':
                 y += cy
-            segments.append(('line', cx, y))
+            append(('line', cx, y))
             cy = y
 
         elif cmd in ('C', 'c'):
@@ -197,9 +263,8 @@ def parse_path_d(d):
                 x1 += cx; y1 += cy
                 x2 += cx; y2 += cy
                 x  += cx; y  += cy
-            pts = cubic_bezier((cx, cy), (x1, y1), (x2, y2), (x, y), CURVE_STEPS)
-            for px, py in pts[1:]:
-                segments.append(('line', px, py))
+            for px, py in flatten_cubic((cx, cy), (x1, y1), (x2, y2), (x, y), tol):
+                append(('line', px, py))
             last_ctrl = (x2, y2)
             cx, cy = x, y
 
@@ -210,9 +275,8 @@ def parse_path_d(d):
                 x  += cx; y  += cy
             x1 = 2*cx - last_ctrl[0] if last_ctrl else cx
             y1 = 2*cy - last_ctrl[1] if last_ctrl else cy
-            pts = cubic_bezier((cx, cy), (x1, y1), (x2, y2), (x, y), CURVE_STEPS)
-            for px, py in pts[1:]:
-                segments.append(('line', px, py))
+            for px, py in flatten_cubic((cx, cy), (x1, y1), (x2, y2), (x, y), tol):
+                append(('line', px, py))
             last_ctrl = (x2, y2)
             cx, cy = x, y
 
@@ -221,9 +285,8 @@ def parse_path_d(d):
             if cmd == 'q':
                 x1 += cx; y1 += cy
                 x  += cx; y  += cy
-            pts = quadratic_bezier((cx, cy), (x1, y1), (x, y), CURVE_STEPS)
-            for px, py in pts[1:]:
-                segments.append(('line', px, py))
+            for px, py in flatten_quadratic((cx, cy), (x1, y1), (x, y), tol):
+                append(('line', px, py))
             last_ctrl = (x1, y1)
             cx, cy = x, y
 
@@ -233,23 +296,23 @@ def parse_path_d(d):
                 x += cx; y += cy
             x1 = 2*cx - last_ctrl[0] if last_ctrl else cx
             y1 = 2*cy - last_ctrl[1] if last_ctrl else cy
-            pts = quadratic_bezier((cx, cy), (x1, y1), (x, y), CURVE_STEPS)
-            for px, py in pts[1:]:
-                segments.append(('line', px, py))
+            for px, py in flatten_quadratic((cx, cy), (x1, y1), (x, y), tol):
+                append(('line', px, py))
             last_ctrl = (x1, y1)
             cx, cy = x, y
 
         elif cmd in ('A', 'a'):
-            # Approximate arc as line to endpoint (good enough for simple logos)
             rx, ry, xrot, large, sweep, x, y = next_nums(7)
             if cmd == 'a':
                 x += cx; y += cy
-            segments.append(('line', x, y))
+            for px, py in arc_to_lines(cx, cy, rx, ry, xrot,
+                                       large != 0, sweep != 0, x, y, tol):
+                append(('line', px, py))
             cx, cy = x, y
 
         elif cmd in ('Z', 'z'):
             if abs(cx - sx) > 0.01 or abs(cy - sy) > 0.01:
-                segments.append(('line', sx, sy))
+                append(('line', sx, sy))
             cx, cy = sx, sy
             cmd = None  # wait for next explicit command
 
@@ -259,22 +322,24 @@ def parse_path_d(d):
 # ── SVG shape helpers ─────────────────────────────────────────────────────────
 def circle_to_segments(cx, cy, r):
     """Approximate a circle as a closed polygon."""
-    segs = []
-    for i in range(CIRCLE_STEPS + 1):
-        angle = 2 * math.pi * i / CIRCLE_STEPS
-        x = cx + r * math.cos(angle)
-        y = cy + r * math.sin(angle)
-        segs.append(('move' if i == 0 else 'line', x, y))
-    return segs
+    return ellipse_to_segments(cx, cy, r, r)
 
 
 def ellipse_to_segments(cx, cy, rx, ry):
-    segs = []
-    for i in range(CIRCLE_STEPS + 1):
-        angle = 2 * math.pi * i / CIRCLE_STEPS
-        x = cx + rx * math.cos(angle)
-        y = cy + ry * math.sin(angle)
-        segs.append(('move' if i == 0 else 'line', x, y))
+    """Closed polygon around an ellipse.
+
+    Points come from the angle-addition recurrence: sin/cos are called
+    once for the step angle, then each unit-circle point follows from
+    the previous one with four multiplies. The last point is snapped
+    back onto the start so float drift can't leave the outline open."""
+    c = math.cos(2 * math.pi / CIRCLE_STEPS)
+    s = math.sin(2 * math.pi / CIRCLE_STEPS)
+    ux, uy = 1.0, 0.0
+    segs = [('move', cx + rx, cy)]
+    for _ in range(CIRCLE_STEPS):
+        ux, uy = c * ux - s * uy, s * ux + c * uy
+        segs.append(('line', cx + rx * ux, cy + ry * uy))
+    segs[-1] = ('line', cx + rx, cy)
     return segs
 
 
@@ -302,24 +367,71 @@ def polyline_to_segments(points_str, close=False):
 
 
 # ── SVG file parser ───────────────────────────────────────────────────────────
-def parse_svg(filepath):
-    """Parse all drawable elements from SVG. Returns list of ('move'|'line', x, y)."""
-    tree = ET.parse(filepath)
-    root = tree.getroot()
+def _flatten_tol(root, size_mm):
+    """
+    Curve-flattening tolerance in SVG units for a drawing scaled to
+    size_mm. The true geometry scale isn't known until after parsing, so
+    approximate it from the declared viewBox (or width/height); if the
+    document declares neither, treat SVG units as mm.
+    """
+    extent = 0.0
+    vb = root.get('viewBox')
+    if vb:
+        parts = re.split(r'[ ,]+', vb.strip())
+        if len(parts) == 4:
+            try:
+                extent = max(float(parts[2]), float(parts[3]))
+            except ValueError:
+                pass
+    if extent <= 0:
+        try:
+            extent = max(
+                float(re.sub(r'[a-z%]*$', '', root.get('width', '0'))),
+                float(re.sub(r'[a-z%]*$', '', root.get('height', '0'))),
+            )
+        except ValueError:
+            pass
+    if extent <= 0 or size_mm <= 0:
+        return FLATTEN_TOL_MM
+    return FLATTEN_TOL_MM * extent / size_mm
 
+
+# Drawable tags, precomputed with and without the SVG namespace so the
+# parse loop dispatches on a dict lookup instead of splitting every tag.
+_SVG_NS = '{http://www.w3.org/2000/svg}'
+_DRAWABLE_TAGS = {}
+for _t in ('path', 'circle', 'ellipse', 'rect', 'line', 'polyline', 'polygon'):
+    _DRAWABLE_TAGS[_t] = _t
+    _DRAWABLE_TAGS[_SVG_NS + _t] = _t
+
+
+def parse_svg(filepath, size_mm=DEFAULT_SIZE):
+    """Parse all drawable elements from SVG. Returns list of ('move'|'line', x, y).
+
+    Streams the file with iterparse instead of building the full DOM:
+    each drawable element is handled on its end event and cleared, so
+    memory stays bounded on large files and non-drawable elements cost
+    one dict lookup."""
     all_segments = []
     count = {'path': 0, 'circle': 0, 'other': 0}
+    tol = FLATTEN_TOL_MM
+    root_seen = False
+
+    for event, elem in ET.iterparse(filepath, events=('start', 'end')):
+        if event == 'start':
+            if not root_seen and elem.tag in (_SVG_NS + 'svg', 'svg'):
+                tol = _flatten_tol(elem, size_mm)
+                root_seen = True
+            continue
 
-    for elem in root.iter():
-        # Strip namespace
-        tag = elem.tag
-        if '}' in tag:
-            tag = tag.split('}', 1)[1]
+        tag = _DRAWABLE_TAGS.get(elem.tag)
+        if tag is None:
+            continue
 
         if tag == 'path':
             d = elem.get('d', '')
             if d:
-                segs = parse_path_d(d)
+                segs = parse_path_d(d, tol)
                 if segs:
                     all_segments.extend(segs)
                     count['path'] += 1
@@ -370,6 +482,8 @@ def parse_svg(filepath):
                 all_segments.extend(polyline_to_segments(pts, close=True))
                 count['other'] += 1
 
+        elem.clear()
+
     total = count['path'] + count['circle'] + count['other']
     print(f"  📄 Parsed {total} element(s): {count['path']} path(s), "
           f"{count['circle']} circle(s), {count['other']} other")
@@ -383,13 +497,22 @@ def transform_segments(segments, size_mm):
     Scale to fit within size_mm, center at (0,0), flip Y axis
     (SVG Y is down; arm Y is up).
     """
-    xs = [x for _, x, _ in segments]
-    ys = [y for _, _, y in segments]
-    if not xs:
+    if not segments:
         return []
 
-    x_min, x_max = min(xs), max(xs)
-    y_min, y_max = min(ys), max(ys)
+    # All four bounds in one pass over the tuples — no xs/ys copies and
+    # no separate min/max traversals.
+    x_min = x_max = segments[0][1]
+    y_min = y_max = segments[0][2]
+    for _, x, y in segments:
+        if x < x_min:
+            x_min = x
+        elif x > x_max:
+            x_max = x
+        if y < y_min:
+            y_min = y
+        elif y > y_max:
+            y_max = y
     w = x_max - x_min
     h = y_max - y_min
 
@@ -400,25 +523,172 @@ def transform_segments(segments, size_mm):
     x_center = (x_min + x_max) / 2
     y_center = (y_min + y_max) / 2
 
-    result = []
-    for kind, x, y in segments:
-        arm_x =  (x - x_center) * scale
-        arm_y = -(y - y_center) * scale   # flip Y
-        result.append((kind, arm_x, arm_y))
+    # One bulk comprehension with the scale factors hoisted (Y negated
+    # once, not per point) instead of a per-tuple append loop.
+    y_scale = -scale   # flip Y
+    result = [
+        (kind, (x - x_center) * scale, (y - y_center) * y_scale)
+        for kind, x, y in segments
+    ]
 
     print(f"  📐 SVG size: {w:.1f}×{h:.1f}px → {w*scale:.1f}×{h*scale:.1f}mm "
           f"(scale {scale:.3f})")
     return result
 
 
+# ── Path ordering ─────────────────────────────────────────────────────────────
+def order_segments(segments):
+    """
+    Reorder disconnected subpaths to minimize pen-up travel.
+
+    SVG element order is arbitrary, and every 'move' costs a full
+    pen-up / travel / pen-down cycle. This splits the list into
+    subpaths (bounded by 'move'), then greedily walks from (0,0) to
+    whichever remaining subpath starts or ends nearest the pen,
+    reversing a subpath when entering from its end. Bare moves with no
+    draw segments are dropped along the way. Greedy nearest neighbor is
+    O(n^2) in subpath count — logos have tens of subpaths, not
+    thousands, so no spatial index is warranted.
+    """
+    subpaths = []
+    cur = []
+    for seg in segments:
+        if seg[0] == 'move':
+            if len(cur) > 1:
+                subpaths.append(cur)
+            cur = [seg]
+        else:
+            if not cur:
+                cur = [('move', 0.0, 0.0)]
+            cur.append(seg)
+    if len(cur) > 1:
+        subpaths.append(cur)
+    if len(subpaths) <= 1:
+        return [s for sp in subpaths for s in sp]
+
+    ordered = []
+    px, py = 0.0, 0.0
+    while subpaths:
+        best_i, best_rev, best_d = 0, False, None
+        for i, sp in enumerate(subpaths):
+            _, sx, sy = sp[0]
+            _, ex, ey = sp[-1]
+            ds = (sx - px) ** 2 + (sy - py) ** 2
+            de = (ex - px) ** 2 + (ey - py) ** 2
+            if best_d is None or ds < best_d:
+                best_i, best_rev, best_d = i, False, ds
+            if de < best_d:
+                best_i, best_rev, best_d = i, True, de
+        sp = subpaths.pop(best_i)
+        if best_rev:
+            pts = [(x, y) for _, x, y in reversed(sp)]
+            sp = [('move',) + pts[0]] + [('line',) + p for p in pts[1:]]
+        ordered.extend(sp)
+        _, px, py = ordered[-1]
+    return ordered
+
+
+def simplify_segments(segments, epsilon_mm=SIMPLIFY_TOL_MM):
+    """
+    Merge runs of near-collinear points left over from curve flattening.
+    Each draw run (the points between two 'move's) goes through RDP with
+    a perpendicular tolerance of epsilon_mm, collapsing straight-ish
+    chains into single segments — less serial traffic, and the planner
+    stops decelerating at junctions that aren't really corners.
+    """
+    out = []
+    run = []   # polyline points of the current draw run, start included
+
+    def flush_run():
+        if not run:
+            return
+        pts = run if len(run) <= 2 else \
+            [p for p, k in zip(run, rdp_keep(run, epsilon_mm)) if k]
+        out.append(('move',) + pts[0])
+        out.extend(('line',) + p for p in pts[1:])
+        run.clear()
+
+    for seg in segments:
+        if seg[0] == 'move':
+            flush_run()
+            run.append((seg[1], seg[2]))
+        else:
+            if not run:
+                run.append((0.0, 0.0))
+            run.append((seg[1], seg[2]))
+    flush_run()
+
+    if len(out) < len(segments):
+        print(f"  ✂️  Simplified {len(segments)} → {len(out)} segments")
+    return out
+
+
 # ── Draw ──────────────────────────────────────────────────────────────────────
+def _fmt_um(um):
+    """Integer micrometers → ASCII mm with three decimals."""
+    sign = b"-" if um < 0 else b""
+    um = abs(um)
+    return b"%s%d.%03d" % (sign, um // 1000, um % 1000)
+
+
+def format_g1(dx_um, dy_um, dz_um, feed):
+    """
+    Relative G1 line as newline-terminated bytes, built from integer
+    micrometers with bytes %-formatting — no float __format__ call per
+    field. Zero axes are omitted, and so is F when feed is None (the
+    firmware keeps the feedrate modally), which also trims bytes off
+    the 115200-baud wire.
+    """
+    line = b"G1"
+    if dx_um:
+        line += b" X" + _fmt_um(dx_um)
+    if dy_um:
+        line += b" Y" + _fmt_um(dy_um)
+    if dz_um:
+        line += b" Z" + _fmt_um(dz_um)
+    if feed is not None:
+        line += b" F%d" % round(feed)
+    return line + b"\n"
+
+
 def draw_segments(g, segments, z_up, draw_feed):
-    """Execute segments as G-code. Pen starts and ends UP at (0,0)."""
+    """Execute segments as G-code. Pen starts and ends UP at (0,0).
+
+    XY moves between pen transitions are formatted up front and handed
+    to GCodeIO.send_many, which packs them into as few serial writes as
+    the firmware RX window allows — the look-ahead planner blends
+    consecutive segments instead of stopping after each one. M400 syncs
+    only bracket pen Z transitions and the final return, where
+    serialized motion actually matters."""
     is_up  = True
     cur_x  = 0.0
     cur_y  = 0.0
     moves  = 0
     lines  = 0
+    batch  = []      # formatted G1 lines since the last pen transition
+    last_feed = None  # feedrate the firmware holds modally
+
+    def flush():
+        if batch:
+            g.send_many(batch)
+            batch.clear()
+
+    def z_move(dz_mm):
+        nonlocal last_feed
+        flush()
+        g.drain()
+        g.send_async(f"G1 Z{dz_mm:.2f} F{TRAVEL_FEED}")
+        g.wait_motion()
+        last_feed = TRAVEL_FEED
+
+    def xy_move(dx, dy, feed):
+        nonlocal last_feed
+        dx_um = round(dx * 1000)
+        dy_um = round(dy * 1000)
+        dz_um = round(TILT_SLOPE * dy * 1000) if TILT_SLOPE else 0
+        batch.append(format_g1(dx_um, dy_um, dz_um,
+                               None if feed == last_feed else feed))
+        last_feed = feed
 
     for kind, x, y in segments:
         dx = x - cur_x
@@ -426,47 +696,71 @@ def draw_segments(g, segments, z_up, draw_feed):
 
         if kind == 'move':
             if not is_up:
-                g.send(f"G1 Z{z_up:.2f} F{TRAVEL_FEED}", wait_ok=True)
-                g.wait_motion()
+                z_move(z_up)
                 is_up = True
             if abs(dx) > 0.01 or abs(dy) > 0.01:
-                dz = TILT_SLOPE * dy
-                z_comp = f" Z{dz:.3f}" if abs(dz) > 0.001 else ""
-                g.send(f"G1 X{dx:.3f} Y{dy:.3f}{z_comp} F{TRAVEL_FEED}", wait_ok=True)
-                g.wait_motion()
+                xy_move(dx, dy, TRAVEL_FEED)
             moves += 1
 
         elif kind == 'line':
             if is_up:
-                g.send(f"G1 Z{-z_up:.2f} F{TRAVEL_FEED}", wait_ok=True)
-                g.wait_motion()
+                z_move(-z_up)
                 is_up = False
             if abs(dx) > 0.01 or abs(dy) > 0.01:
-                dz = TILT_SLOPE * dy
-                z_comp = f" Z{dz:.3f}" if abs(dz) > 0.001 else ""
-                g.send(f"G1 X{dx:.3f} Y{dy:.3f}{z_comp} F{draw_feed}", wait_ok=True)
-                g.wait_motion()
+                xy_move(dx, dy, draw_feed)
             lines += 1
 
         cur_x, cur_y = x, y
 
     # Lift pen
     if not is_up:
-        g.send(f"G1 Z{z_up:.2f} F{TRAVEL_FEED}", wait_ok=True)
-        g.wait_motion()
+        z_move(z_up)
 
     # Return to center (0, 0)
     dx = -cur_x
     dy = -cur_y
     if abs(dx) > 0.01 or abs(dy) > 0.01:
-        dz = TILT_SLOPE * dy
-        z_comp = f" Z{dz:.3f}" if abs(dz) > 0.001 else ""
-        g.send(f"G1 X{dx:.3f} Y{dy:.3f}{z_comp} F{TRAVEL_FEED}", wait_ok=True)
-        g.wait_motion()
+        xy_move(dx, dy, TRAVEL_FEED)
+    flush()
+    g.drain()
+    g.wait_motion()
 
     print(f"  📊 {moves} pen-up moves, {lines} draw moves")
 
 
+# ── Entry points ──────────────────────────────────────────────────────────────
+def load_calibration():
+    global Z_UP, TILT_SLOPE
+    cal = read_calibration()
+    if cal is not None:
+        Z_UP       = cal.get("z_up", Z_UP)
+        TILT_SLOPE = cal.get("tilt_slope", 0.0)
+        tilt_info  = f", tilt={TILT_SLOPE:.4f} mm/mm" if TILT_SLOPE != 0 else ""
+        print(f"  📐 Calibration: Z_UP = {Z_UP:.1f}mm{tilt_info}")
+
+
+def run_svg(svg_path, g, size=DEFAULT_SIZE, feed=DEFAULT_FEED):
+    """
+    Parse and draw an SVG on an already-open GCodeIO (G21/G91 must be set).
+    Lets callers (bob_ross.py) reuse one serial connection instead of
+    paying a DTR reset per subprocess. Raises ValueError if the file has
+    no drawable elements.
+    """
+    load_calibration()
+
+    print(f"HUENIT SVG — {os.path.basename(svg_path)} @ max {size}mm | Port: {PORT}")
+
+    segments = parse_svg(svg_path, size)
+    if not segments:
+        raise ValueError("No drawable elements found in SVG.")
+
+    segments = transform_segments(segments, size)
+    segments = order_segments(segments)
+    segments = simplify_segments(segments)
+    draw_segments(g, segments, Z_UP, feed)
+    print("\n  ✅ Done! (pen is up — safe to remove paper)")
+
+
 # ── Main ──────────────────────────────────────────────────────────────────────
 def main():
     parser = argparse.ArgumentParser(description="Draw an SVG with the Huenit robot arm")
@@ -483,32 +777,16 @@ def main():
 
     check_ready()
 
-    global Z_UP, TILT_SLOPE
-    if os.path.exists(CALIBRATION_FILE):
-        with open(CALIBRATION_FILE) as f:
-            cal = json.load(f)
-        Z_UP       = cal.get("z_up", Z_UP)
-        TILT_SLOPE = cal.get("tilt_slope", 0.0)
-        tilt_info  = f", tilt={TILT_SLOPE:.4f} mm/mm" if TILT_SLOPE != 0 else ""
-        print(f"  📐 Calibration: Z_UP = {Z_UP:.1f}mm{tilt_info}")
-
-    print(f"HUENIT SVG — {os.path.basename(args.svg)} @ max {args.size}mm | Port: {PORT}")
-
-    segments = parse_svg(args.svg)
-    if not segments:
-        print("  ❌ No drawable elements found in SVG.")
-        sys.exit(1)
-
-    segments = transform_segments(segments, args.size)
-
     g = GCodeIO(PORT, BAUD)
     try:
-        g.send("G21", wait_ok=True)
-        g.send("G91", wait_ok=True)
-        draw_segments(g, segments, Z_UP, args.feed)
-        print("\n  ✅ Done! (pen is up — safe to remove paper)")
+        g.set_modes("G21", "G91")  # metric, relative — one line, one ok
+        try:
+            run_svg(args.svg, g, size=args.size, feed=args.feed)
+        except ValueError as e:
+            print(f"  ❌ {e}")
+            sys.exit(1)
     finally:
-        g.send("G90", wait_ok=True)
+        g.set_modes("G90")
         g.close()
 
 
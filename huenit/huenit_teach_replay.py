@@ -22,7 +22,7 @@ Notes:
   - Dependency: pip install pyserial
 """
 
-import os, sys, time, re, math, threading, csv
+import os, sys, time, re, math, threading, csv, select
 from datetime import datetime
 
 # ------------------------- Configuration --------------------------------------
@@ -173,15 +173,16 @@ class GCodeIO:
         try: self.ser.close()
         except: pass
     def _rx_loop(self):
+        # Block in select instead of sleep-polling in_waiting: bytes are
+        # picked up on kernel wake (<1 ms) rather than after a 3 ms nap.
+        fd = self.ser.fileno()
         while self.ser.is_open:
             try:
-                n=self.ser.in_waiting
-                if n:
-                    d=self.ser.read(n)
+                r,_,_ = select.select([fd], [], [], 0.1)
+                if r:
+                    d = os.read(fd, 4096)
                     if d:
                         with self.lock: self.buf.extend(d)
-                else:
-                    time.sleep(0.003)
             except: break
     def read_available_text(self, clear=True):
         with self.lock:
@@ -15,8 +15,9 @@ Options:
     --feed N        Drawing feed rate mm/min (default 400)
 """
 
-import sys, os, time, re, math, threading, json, argparse, subprocess
-import serial
+import sys, os, json, argparse, functools, subprocess
+
+from huenit_draw import GCodeIO, rdp_keep, read_calibration
 
 # ── Config ────────────────────────────────────────────────────────────────────
 PORT = os.environ.get("HUENIT_PORT", "/dev/cu.usbserial-310")
@@ -24,14 +25,13 @@ BAUD = 115200
 DEFAULT_DRAW_FEED = 400
 TRAVEL_FEED = 800
 Z_UP = 3.0  # default, overridden by calibration
+SHORT_HOP_MM = 0.5  # reduced lift for travels between strokes of one glyph
 
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 CALIBRATION_FILE = os.path.join(SCRIPT_DIR, "calibration.json")
 READY_FLAG = "/tmp/huenit_ready.flag"
 TILT_SLOPE = 0.0      # mm of Z correction per mm of Y travel (loaded from calibration)
 
-OK_PAT = re.compile(rb"\bok\b", re.I)
-
 
 def check_ready():
     if not os.path.exists(READY_FLAG):
@@ -167,77 +167,75 @@ FONT = {
 }
 
 
+@functools.lru_cache(maxsize=256)
+def scaled_strokes(ch, size):
+    """
+    Stroke points for `ch` scaled from the unit grid to `size` mm,
+    computed once per (char, size) pair. render_text then only adds the
+    cursor offset per point instead of redoing the multiply for every
+    repeated letter. Near-collinear interior points are dropped with a
+    tolerance of 0.5% of the letter height, so oversampled strokes (a
+    densely digitized O or S) collapse to the moves the pen can actually
+    distinguish instead of everything the font author drew.
+    """
+    eps = 0.005 * size
+    strokes = []
+    for stroke in FONT[ch]:
+        pts = [(px * size, py * size) for px, py in stroke]
+        if len(pts) > 2:
+            pts = [p for p, k in zip(pts, rdp_keep(pts, eps)) if k]
+        strokes.append(tuple(pts))
+    return tuple(strokes)
+
+
+# Normalized character widths (0-1 scale), built once at import so the
+# per-character lookup is a plain dict get.
+WIDTHS = {c: 0.9 for c in FONT}
+WIDTHS[' '] = 0.5
+WIDTHS['I'] = WIDTHS['!'] = WIDTHS['.'] = WIDTHS['1'] = 0.6
+WIDTHS['M'] = WIDTHS['W'] = 1.0
+
+
 def get_letter_width(ch):
-    """Return the normalized width of a character (0-1 scale)."""
-    ch = ch.upper()
-    if ch == ' ':
-        return 0.5
-    if ch == 'I' or ch == '!' or ch == '.' or ch == '1':
-        return 0.6
-    if ch == 'M' or ch == 'W':
-        return 1.0
-    return 0.9
+    """Return the normalized width of an uppercase character (0-1 scale)."""
+    return WIDTHS.get(ch, 0.9)
+
+
+def layout_line(line, size, spacing):
+    """
+    Walk the string once, returning (width_mm, placements) where each
+    placement is (cursor_x, ch) for a character that actually draws.
+    One pass supplies both the centering offset and everything
+    render_text needs, instead of measuring and then re-iterating.
+    """
+    placements = []
+    cursor_x = 0.0
+    for ch in line:
+        ch_upper = ch.upper()
+        if ch_upper not in FONT:
+            print(f"  ⚠ Unknown character '{ch}', skipping")
+            cursor_x += size * 0.5 + spacing
+            continue
+        if FONT[ch_upper]:
+            placements.append((cursor_x, ch_upper))
+        cursor_x += size * WIDTHS[ch_upper] + spacing
+    return max(0.0, cursor_x - spacing), placements
 
 
 def calculate_text_width(text, size, spacing):
     """Return total width of text string in mm."""
-    total = 0.0
-    for ch in text:
-        total += size * get_letter_width(ch.upper()) + spacing
-    if text:
-        total -= spacing  # no trailing spacing after last character
-    return total
-
-
-# ── Serial / G-code ──────────────────────────────────────────────────────────
-class GCodeIO:
-    def __init__(self, port, baud):
-        self.ser = serial.Serial(port, baud, timeout=0.05)
-        self.buf = bytearray()
-        self.lock = threading.Lock()
-        self._rx = threading.Thread(target=self._rx_loop, daemon=True)
-        self._rx.start()
-
-    def _rx_loop(self):
-        while self.ser.is_open:
-            try:
-                n = self.ser.in_waiting
-                if n:
-                    d = self.ser.read(n)
-                    if d:
-                        with self.lock:
-                            self.buf.extend(d)
-                else:
-                    time.sleep(0.005)
-            except:
-                break
-
-    def send(self, line, wait_ok=True, timeout=10.0):
-        self.ser.write((line.strip() + "\n").encode("ascii", "ignore"))
-        self.ser.flush()
-        if not wait_ok:
-            return
-        t0 = time.time()
-        while time.time() - t0 < timeout:
-            time.sleep(0.01)
-            with self.lock:
-                if OK_PAT.search(self.buf):
-                    self.buf.clear()
-                    return
-        print(f"  ⚠ timeout waiting for ok on: {line}")
-
-    def wait_motion(self):
-        self.send("M400", wait_ok=True, timeout=30.0)
-
-    def close(self):
-        try:
-            self.ser.close()
-        except:
-            pass
+    return layout_line(text, size, spacing)[0]
 
 
 # ── Drawing primitives ────────────────────────────────────────────────────────
 class Pen:
+    """
+    Cursor-tracking pen over a GCodeIO. XY strokes are streamed into the
+    firmware planner without per-move syncs — the look-ahead planner
+    blends consecutive stroke points. Only Z transitions serialize, via
+    drain + M400, so the pen state on paper always matches is_up.
+    """
+
     def __init__(self, g, z_up, draw_feed):
         self.g = g
         self.z_up = z_up
@@ -245,16 +243,24 @@ class Pen:
         self.is_up = False
         self.cursor_x = 0.0  # track relative position
         self.cursor_y = 0.0
+        self._lift = z_up    # height of the current lift, for down()
 
-    def up(self):
+    def up(self, hop=None):
+        """Lift the pen. `hop` lifts by a reduced height for short
+        travels between strokes of the same glyph; the default is the
+        full calibrated travel height."""
         if not self.is_up:
-            self.g.send(f"G1 Z{self.z_up:.2f} F{TRAVEL_FEED}", wait_ok=True)
+            dz = hop if hop else self.z_up
+            self.g.drain()
+            self.g.send_async(f"G1 Z{dz:.2f} F{TRAVEL_FEED}")
             self.g.wait_motion()
             self.is_up = True
+            self._lift = dz
 
     def down(self):
         if self.is_up:
-            self.g.send(f"G1 Z{-self.z_up:.2f} F{TRAVEL_FEED}", wait_ok=True)
+            self.g.drain()
+            self.g.send_async(f"G1 Z{-self._lift:.2f} F{TRAVEL_FEED}")
             self.g.wait_motion()
             self.is_up = False
 
@@ -265,8 +271,7 @@ class Pen:
         if abs(dx) > 0.01 or abs(dy) > 0.01:
             dz = TILT_SLOPE * dy
             z_comp = f" Z{dz:.3f}" if abs(dz) > 0.001 else ""
-            self.g.send(f"G1 X{dx:.3f} Y{dy:.3f}{z_comp} F{TRAVEL_FEED}", wait_ok=True)
-            self.g.wait_motion()
+            self.g.send_async(f"G1 X{dx:.3f} Y{dy:.3f}{z_comp} F{TRAVEL_FEED}")
         self.cursor_x = x
         self.cursor_y = y
 
@@ -277,50 +282,105 @@ class Pen:
         if abs(dx) > 0.01 or abs(dy) > 0.01:
             dz = TILT_SLOPE * dy
             z_comp = f" Z{dz:.3f}" if abs(dz) > 0.001 else ""
-            self.g.send(f"G1 X{dx:.3f} Y{dy:.3f}{z_comp} F{self.draw_feed}", wait_ok=True)
-            self.g.wait_motion()
+            self.g.send_async(f"G1 X{dx:.3f} Y{dy:.3f}{z_comp} F{self.draw_feed}")
         self.cursor_x = x
         self.cursor_y = y
 
 
 # ── Text rendering ────────────────────────────────────────────────────────────
-def render_text(pen, text, size, spacing):
-    """Render text string. Letters are drawn in X direction, Y is up."""
-    cursor_x = 0.0
-
-    for ch in text:
-        ch_upper = ch.upper()
-        strokes = FONT.get(ch_upper, None)
-        if strokes is None:
-            print(f"  ⚠ Unknown character '{ch}', skipping")
-            cursor_x += size * 0.5 + spacing
+# Sentinels interleaved with G-code lines in a cached glyph program: pen
+# lifts/drops need the drain + M400 serialization that Pen provides, so
+# they stay as ops rather than raw Z lines.
+_PEN_UP = object()
+_PEN_DOWN = object()
+
+
+@functools.lru_cache(maxsize=512)
+def glyph_gcode(ch, size, feed, tilt):
+    """
+    Pre-formatted relative G-code program for one glyph.
+
+    In G91 every stroke move is a delta, so a glyph's lines are identical
+    at any cursor position — the caller translates with a single pen-up
+    move to the glyph's first stroke point and then replays the cached
+    program verbatim. Repeated letters cost zero formatting.
+
+    Returns (ops, sx, sy, ex, ey): `ops` is a tuple of encoded G-code
+    lines and _PEN_UP/_PEN_DOWN sentinels; (sx, sy) is the entry point
+    and (ex, ey) the exit point, both in glyph-local mm.
+    """
+    strokes = [s for s in scaled_strokes(ch, size) if len(s) >= 2]
+    if not strokes:
+        return (), 0.0, 0.0, 0.0, 0.0
+
+    def rel_line(dx, dy, f):
+        dz = tilt * dy
+        z_comp = f" Z{dz:.3f}" if abs(dz) > 0.001 else ""
+        return f"G1 X{dx:.3f} Y{dy:.3f}{z_comp} F{f}\n".encode("ascii")
+
+    sx, sy = strokes[0][0]
+    x, y = sx, sy
+    ops = []
+    for stroke in strokes:
+        px, py = stroke[0]
+        if abs(px - x) > 0.01 or abs(py - y) > 0.01:
+            # Lift only when the next stroke starts elsewhere; strokes
+            # that begin where the last one ended (the two bowls of '3')
+            # chain pen-down into one continuous run.
+            ops.append(_PEN_UP)
+            ops.append(rel_line(px - x, py - y, TRAVEL_FEED))
+            ops.append(_PEN_DOWN)
+        elif not ops:
+            ops.append(_PEN_DOWN)
+        x, y = px, py
+        for px, py in stroke[1:]:
+            if abs(px - x) > 0.01 or abs(py - y) > 0.01:
+                ops.append(rel_line(px - x, py - y, feed))
+            x, y = px, py
+    return tuple(ops), sx, sy, x, y
+
+
+def render_text(pen, placements, size):
+    """Render characters laid out by layout_line. Letters are drawn in
+    the X direction, Y is up."""
+    pen_up, pen_down = pen.up, pen.down
+    send_many = pen.g.send_many
+
+    for cursor_x, ch in placements:
+        ops, sx, sy, ex, ey = glyph_gcode(ch, size, pen.draw_feed,
+                                          TILT_SLOPE)
+        if not ops:
             continue
 
-        w = get_letter_width(ch_upper)
-
-        if not strokes:
-            # Space or empty character
-            cursor_x += size * w + spacing
-            continue
-
-        print(f"  ✍ '{ch_upper}'")
-
-        for stroke in strokes:
-            if len(stroke) < 2:
-                continue
-
-            # Move to first point (pen up)
-            px, py = stroke[0]
-            pen.up()
-            pen.move_to_abs(cursor_x + px * size, py * size)
-
-            # Draw through remaining points
-            pen.down()
-            for px, py in stroke[1:]:
-                pen.draw_to_abs(cursor_x + px * size, py * size)
-
-        pen.up()
-        cursor_x += size * w + spacing
+        print(f"  ✍ '{ch}'")
+
+        # One translate move to the glyph entry, then replay the cached
+        # relative program; only the exit point needs tracking. Runs of
+        # lines between pen lifts go out as batched writes.
+        pen_up()
+        pen.move_to_abs(cursor_x + sx, sy)
+        run = []
+        for op in ops:
+            if op is _PEN_UP:
+                if run:
+                    send_many(run)
+                    run = []
+                # Intra-glyph travels span a few mm at most — a short
+                # hop clears the paper without two full-height Z moves.
+                pen_up(SHORT_HOP_MM)
+            elif op is _PEN_DOWN:
+                if run:
+                    send_many(run)
+                    run = []
+                pen_down()
+            else:
+                run.append(op)
+        if run:
+            send_many(run)
+        pen.cursor_x = cursor_x + ex
+        pen.cursor_y = ey
+
+        pen_up()
 
     # Return to start
     pen.move_to_abs(0, 0)
@@ -350,24 +410,11 @@ def play_sound(filepath):
         print(f"  ⚠ Sound error: {e}")
 
 
-# ── Main ──────────────────────────────────────────────────────────────────────
-def main():
-    parser = argparse.ArgumentParser(description="Write text with the Huenit robot arm")
-    parser.add_argument("text", help="Text to write")
-    parser.add_argument("--size", type=float, default=10.0, help="Letter height in mm (default 10)")
-    parser.add_argument("--spacing", type=float, default=2.0, help="Space between letters in mm (default 2)")
-    parser.add_argument("--sound", type=str, default=None, help="MP3 to play before drawing")
-    parser.add_argument("--feed", type=float, default=DEFAULT_DRAW_FEED, help="Draw feed rate mm/min (default 400)")
-    parser.add_argument("--line-spacing", type=float, default=1.5, help="Line height multiplier (default 1.5x letter height)")
-    args = parser.parse_args()
-
-    check_ready()
-
-    # Load calibration
+# ── Entry points ──────────────────────────────────────────────────────────────
+def load_calibration():
     global Z_UP, TILT_SLOPE
-    if os.path.exists(CALIBRATION_FILE):
-        with open(CALIBRATION_FILE) as f:
-            cal = json.load(f)
+    cal = read_calibration()
+    if cal is not None:
         Z_UP       = cal.get("z_up", Z_UP)
         TILT_SLOPE = cal.get("tilt_slope", 0.0)
         tilt_info  = f", tilt={TILT_SLOPE:.4f} mm/mm" if TILT_SLOPE != 0 else ""
@@ -375,71 +422,92 @@ def main():
     else:
         print(f"  📐 No calibration — using Z_UP = {Z_UP:.1f}mm")
 
-    # Support \n in text (literal backslash-n or real newline)
-    lines = args.text.replace('\\n', '\n').split('\n')
-    line_height = args.size * args.line_spacing
-    preview = args.text.replace('\n', ' / ')
-    print(f"HUENIT Write — '{preview}' @ {args.size}mm | {len(lines)} line(s) | Port: {PORT}")
-
-    # Play sound before starting
-    if args.sound:
-        play_sound(args.sound)
 
-    g = GCodeIO(PORT, BAUD)
-    try:
-        g.send("G21", wait_ok=True)
-        g.send("G91", wait_ok=True)
+def run_write(text, g, size=10.0, spacing=2.0, feed=DEFAULT_DRAW_FEED,
+              line_spacing=1.5):
+    """
+    Write text on an already-open GCodeIO (G21/G91 must be set).
+    Lets callers (bob_ross.py) reuse one serial connection instead of
+    paying a DTR reset per subprocess.
+    """
+    load_calibration()
 
-        total_y_moved = 0.0
+    # Support \n in text (literal backslash-n or real newline)
+    lines = text.replace('\\n', '\n').split('\n')
+    line_height = size * line_spacing
+    preview = text.replace('\n', ' / ')
+    print(f"HUENIT Write — '{preview}' @ {size}mm | {len(lines)} line(s) | Port: {PORT}")
 
-        for i, line in enumerate(lines):
-            line_label = f"Line {i+1}/{len(lines)}" if len(lines) > 1 else "Centering"
+    total_y_moved = 0.0
 
-            if not line.strip():
-                # Empty line — just advance vertically
-                if i < len(lines) - 1:
-                    g.send(f"G1 Y{-line_height:.3f} F{TRAVEL_FEED}", wait_ok=True)
-                    g.wait_motion()
-                    total_y_moved += line_height
-                continue
+    for i, line in enumerate(lines):
+        line_label = f"Line {i+1}/{len(lines)}" if len(lines) > 1 else "Centering"
 
-            total_width = calculate_text_width(line, args.size, args.spacing)
-            offset = total_width / 2.0
-            print(f"  ↔  {line_label}: width={total_width:.1f}mm, shifting left {offset:.1f}mm")
+        if not line.strip():
+            # Empty line — just advance vertically
+            if i < len(lines) - 1:
+                g.send_async(f"G1 Y{-line_height:.3f} F{TRAVEL_FEED}")
+                total_y_moved += line_height
+            continue
 
-            g.send(f"G1 X{-offset:.3f} F{TRAVEL_FEED}", wait_ok=True)
-            g.wait_motion()
+        total_width, placements = layout_line(line, size, spacing)
+        offset = total_width / 2.0
+        print(f"  ↔  {line_label}: width={total_width:.1f}mm, shifting left {offset:.1f}mm")
 
-            pen = Pen(g, Z_UP, args.feed)
-            pen.is_up = True
+        g.send_async(f"G1 X{-offset:.3f} F{TRAVEL_FEED}")
 
-            print(f"  ✍ {line_label}: {line}")
-            render_text(pen, line, args.size, args.spacing)
+        pen = Pen(g, Z_UP, feed)
+        pen.is_up = True
 
-            pen.up()
-            g.send(f"G1 X{offset:.3f} F{TRAVEL_FEED}", wait_ok=True)
-            g.wait_motion()
+        print(f"  ✍ {line_label}: {line}")
+        render_text(pen, placements, size)
 
-            if i < len(lines) - 1:
-                dy = -line_height
-                dz = TILT_SLOPE * dy
-                z_comp = f" Z{dz:.3f}" if abs(dz) > 0.001 else ""
-                g.send(f"G1 Y{dy:.3f}{z_comp} F{TRAVEL_FEED}", wait_ok=True)
-                g.wait_motion()
-                total_y_moved += line_height
+        pen.up()
+        g.send_async(f"G1 X{offset:.3f} F{TRAVEL_FEED}")
 
-        # Return to original Y position
-        if total_y_moved > 0:
-            dy = total_y_moved
+        if i < len(lines) - 1:
+            dy = -line_height
             dz = TILT_SLOPE * dy
             z_comp = f" Z{dz:.3f}" if abs(dz) > 0.001 else ""
-            g.send(f"G1 Y{dy:.3f}{z_comp} F{TRAVEL_FEED}", wait_ok=True)
-            g.wait_motion()
+            g.send_async(f"G1 Y{dy:.3f}{z_comp} F{TRAVEL_FEED}")
+            total_y_moved += line_height
+
+    # Return to original Y position
+    if total_y_moved > 0:
+        dy = total_y_moved
+        dz = TILT_SLOPE * dy
+        z_comp = f" Z{dz:.3f}" if abs(dz) > 0.001 else ""
+        g.send_async(f"G1 Y{dy:.3f}{z_comp} F{TRAVEL_FEED}")
 
-        print(f"\n  ✅ Done! (pen is up — safe to remove paper)")
+    g.drain()
+    g.wait_motion()
+    print(f"\n  ✅ Done! (pen is up — safe to remove paper)")
 
+
+# ── Main ──────────────────────────────────────────────────────────────────────
+def main():
+    parser = argparse.ArgumentParser(description="Write text with the Huenit robot arm")
+    parser.add_argument("text", help="Text to write")
+    parser.add_argument("--size", type=float, default=10.0, help="Letter height in mm (default 10)")
+    parser.add_argument("--spacing", type=float, default=2.0, help="Space between letters in mm (default 2)")
+    parser.add_argument("--sound", type=str, default=None, help="MP3 to play before drawing")
+    parser.add_argument("--feed", type=float, default=DEFAULT_DRAW_FEED, help="Draw feed rate mm/min (default 400)")
+    parser.add_argument("--line-spacing", type=float, default=1.5, help="Line height multiplier (default 1.5x letter height)")
+    args = parser.parse_args()
+
+    check_ready()
+
+    # Play sound before starting
+    if args.sound:
+        play_sound(args.sound)
+
+    g = GCodeIO(PORT, BAUD)
+    try:
+        g.set_modes("G21", "G91")  # metric, relative — one line, one ok
+        run_write(args.text, g, size=args.size, spacing=args.spacing,
+                  feed=args.feed, line_spacing=args.line_spacing)
     finally:
-        g.send("G90", wait_ok=True)
+        g.set_modes("G90")
         g.close()
 
 
@@ -2,17 +2,30 @@ import os
 import sys
 import subprocess
 
-def speak(text):
+def speak(text, wait=False):
+    """Speak text via macOS `say`. Fire-and-forget by default so callers
+    can keep drawing while the phrase plays; pass wait=True when the
+    caller needs speech to finish before continuing (the daemon does, to
+    keep phrases from overlapping). Returns the `say` process."""
     print(f"Narrating: {text}")
     # Using the high-quality 'Evan' voice built into macOS
-    # -v Evan sets the voice, -r 150 slows it down slightly for a Bob Ross feel
+    # -v Evan sets the voice, -r 160 slows it down slightly for a Bob Ross feel
     try:
-        subprocess.run(['say', '-v', 'Evan', '-r', '160', text])
+        proc = subprocess.Popen(
+            ['say', '-v', 'Evan', '-r', '160', text],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+        )
+        if wait:
+            proc.wait()
+        return proc
     except Exception as e:
         print(f"Error playing voice: {e}")
+        return None
 
 if __name__ == "__main__":
     if len(sys.argv) > 1:
-        speak(sys.argv[1])
+        speak(sys.argv[1], wait=True)
     else:
-        speak("Ready to paint some happy little trees.")
+        speak("Ready to paint some happy little trees.", wait=True)
@@ -0,0 +1,24 @@
+#!/usr/bin/env python3
+"""
+speak_daemon.py
+---------------
+Long-running voice worker: reads one phrase per line on stdin, speaks it,
+and answers "done" on stdout. Spawned by bob_ross.py so a session pays a
+single Python startup instead of one per phrase.
+"""
+
+import sys
+
+from speak import speak
+
+
+def main():
+    for line in sys.stdin:
+        text = line.rstrip("\n")
+        if text:
+            speak(text, wait=True)
+        print("done", flush=True)
+
+
+if __name__ == "__main__":
+    main()